@@ -23,11 +23,12 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import inspect
+import datetime
 import logging
 import pathlib
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from dataclasses import MISSING, dataclass, field, fields
+from functools import cached_property
+from typing import Any, Callable, ClassVar, Optional, Union
 
 from easy_release_automation.core.utils.yaml_handler import YamlHandler
 import graphlib
@@ -35,22 +36,69 @@ import graphlib
 logger = logging.getLogger(__name__)
 
 
+GLOBAL_CONFIG_KEY = "global_config"
+REPOSITORIES_KEY = "repositories"
 DEPENDENCY_KEY = "dependencies"
 PLUGINS_KEY = "plugins"
 REPOSITORY_NAME_KEY = "name"
+REPOSITORY_URL_KEY = "url"
 
 
 class DictInitializedDataclass:
     """Allows to initialize a dataclass from a dictionary that contains more keys than the
     dataclass.
+
+    NOTE: The constructor reading the dictionary is generated once per dataclass on first use. It
+    solely reads the keys of the dataclass fields, so that additional keys are ignored.
     """
 
+    _era_from_dict: ClassVar[Callable[[dict[str, Any]], Any]]
+
     @classmethod
     def from_dict(cls, parameters: dict[str, Any]):
-        filtered_dict = {
-            k: v for k, v in parameters.items() if k in inspect.signature(cls).parameters
-        }
-        return cls(**filtered_dict)
+        constructor = cls.__dict__.get("_era_from_dict")
+        if constructor is None:
+            constructor = cls._generate_from_dict()
+            cls._era_from_dict = constructor
+        try:
+            return constructor(parameters)
+        except KeyError as error:
+            raise TypeError(
+                f"{cls.__name__}.from_dict() missing required key: {error.args[0]}"
+            ) from error
+
+    @classmethod
+    def _generate_from_dict(cls) -> Callable[[dict[str, Any]], Any]:
+        """Generates a function, that constructs the dataclass from the given dictionary.
+
+        Returns:
+            the generated constructor function.
+        """
+        namespace: dict[str, Any] = {"_cls": cls}
+        arguments = []
+        for cls_field in fields(cls):  # type: ignore [arg-type]
+            if not cls_field.init:
+                continue
+            name = cls_field.name
+            if cls_field.default is not MISSING:
+                namespace[f"_default_{name}"] = cls_field.default
+                value = f"_get({name!r}, _default_{name})"
+            elif cls_field.default_factory is not MISSING:
+                namespace[f"_factory_{name}"] = cls_field.default_factory
+                value = f"parameters[{name!r}] if {name!r} in parameters else _factory_{name}()"
+            else:
+                value = f"parameters[{name!r}]"
+            # Positional arguments are cheaper to bind than keyword arguments.
+            arguments.append(f"{name}={value}" if getattr(cls_field, "kw_only", False) else value)
+
+        source = (
+            "def from_dict(parameters):\n"
+            "    _get = parameters.get\n"
+            f"    return _cls({', '.join(arguments)})\n"
+        )
+        # NOTE: The source is solely built from the field names of the dataclass.
+        exec(source, namespace)
+        return namespace["from_dict"]
 
 
 @dataclass
@@ -67,12 +115,21 @@ class GlobalConfig(DictInitializedDataclass):
                 overwritten.
         test_run: if set to True, changes and commits are only executed locally and not pushed into
             the remote repository.
+        release_date: date of the release in the format YYYY-MM-DD, that is, e.g., used for the
+            changelog entries. Defaults to the date, when the configuration is read, so that all
+            repositories of a release share the same date.
     """
 
     git_user_name: str
     git_user_email: str
     tag_policy: str = "skip"
     test_run: bool = False
+    release_date: str = field(default_factory=lambda: datetime.date.today().isoformat())
+
+    def __post_init__(self):
+        # Unquoted dates are parsed as date by yaml.
+        if isinstance(self.release_date, datetime.date):
+            self.release_date = self.release_date.isoformat()
 
 
 @dataclass
@@ -114,7 +171,7 @@ class PrivateReleaseEntry(DictInitializedDataclass):
     tag_message: str = ""
     tag_policy: Optional[str] = None
     meta_data: Any = None
-    dependencies: dict[str, PublicReleaseEntry] = field(default_factory=lambda: {})
+    dependencies: dict[str, PublicReleaseEntry] = field(default_factory=dict)
     should_skip: bool = False
 
 
@@ -130,11 +187,35 @@ class PluginEntries(DictInitializedDataclass):
         release_validation: container for plugins modifying the release-branch.
         merge_back_finalization: container for plugins finalizing the merge-back-branch. This allows
             to prepare for merging back into the main branch, e.g., adapting the changelog.
+        parallel_validation: if set to True, the release-validation plugins are executed
+            concurrently. Solely applicable, if the validations do not interfere with each other.
     """
 
-    release_modification: list[dict[str, Optional[dict]]] = field(default_factory=lambda: [])
-    release_validation: list[dict[str, Optional[dict]]] = field(default_factory=lambda: [])
-    merge_back_finalization: list[dict[str, Optional[dict]]] = field(default_factory=lambda: [])
+    release_modification: list[dict[str, Optional[dict]]] = field(default_factory=list)
+    release_validation: list[dict[str, Optional[dict]]] = field(default_factory=list)
+    merge_back_finalization: list[dict[str, Optional[dict]]] = field(default_factory=list)
+    parallel_validation: bool = False
+
+    # NOTE: The plugin names are computed once, as the plugins do not change during the release.
+    @cached_property
+    def release_modification_names(self) -> str:
+        """Comma separated names of the release-modification plugins."""
+        return _join_plugin_names(self.release_modification)
+
+    @cached_property
+    def release_validation_names(self) -> str:
+        """Comma separated names of the release-validation plugins."""
+        return _join_plugin_names(self.release_validation)
+
+    @cached_property
+    def merge_back_finalization_names(self) -> str:
+        """Comma separated names of the merge-back-finalization plugins."""
+        return _join_plugin_names(self.merge_back_finalization)
+
+
+def _join_plugin_names(plugins: list[dict[str, Optional[dict]]]) -> str:
+    """Joins the names of the given plugins to a comma separated string."""
+    return ", ".join(", ".join(plugin.keys()) for plugin in plugins)
 
 
 @dataclass
@@ -149,6 +230,12 @@ class ConfigurationHandlerException(Exception):
     """Exception that is raised during this release"""
 
 
+# Names of the plugin stages that can be configured for a release-entry.
+_PLUGIN_STAGES = frozenset(
+    stage.name for stage in fields(PluginEntries) if stage.default_factory is list
+)
+
+
 def get_configuration(
     configuration_path: pathlib.Path,
     test_run: Optional[bool],
@@ -188,12 +275,114 @@ def get_file_configuration(path: pathlib.Path) -> tuple[GlobalConfig, list[Relea
     """
 
     config = YamlHandler.get_config(str(path))
-    global_config = GlobalConfig.from_dict(config["global_config"])
-    release_entries = build_release_entries(config["repositories"])
+    validate_configuration(config)
+    global_config = GlobalConfig.from_dict(config[GLOBAL_CONFIG_KEY])
+    release_entries = build_release_entries(config[REPOSITORIES_KEY])
 
     return global_config, topological_sort(release_entries)
 
 
+def validate_configuration(config: Any):
+    """Validates the structure of the raw configuration, before any release-entry is built. This
+    allows to fail early with the path of the invalid configuration parameter.
+
+    Args:
+        config: raw configuration given by the configuration file.
+    Raises:
+        ConfigurationHandlerException: if the configuration has an invalid structure.
+    """
+    _validate_type(config, dict, "<root>")
+    for key in (GLOBAL_CONFIG_KEY, REPOSITORIES_KEY):
+        _validate_type(config.get(key), dict, key)
+    for key in ("git_user_name", "git_user_email"):
+        if key not in config[GLOBAL_CONFIG_KEY]:
+            raise ConfigurationHandlerException(f"Missing parameter: {GLOBAL_CONFIG_KEY}/{key}")
+    _validate_release_date(
+        config[GLOBAL_CONFIG_KEY].get("release_date", datetime.date.today()),
+        f"{GLOBAL_CONFIG_KEY}/release_date",
+    )
+
+    for name, entry in config[REPOSITORIES_KEY].items():
+        _validate_repository(entry, f"{REPOSITORIES_KEY}/{name}")
+
+
+def _validate_repository(entry: Any, path: str):
+    """Validates the structure of a single raw release-entry.
+
+    Args:
+        entry: raw release-entry given by the configuration file.
+        path: path of the release-entry within the configuration file.
+    Raises:
+        ConfigurationHandlerException: if the release-entry has an invalid structure.
+    """
+    _validate_type(entry, dict, path)
+    _validate_type(entry.get(REPOSITORY_URL_KEY), str, f"{path}/{REPOSITORY_URL_KEY}")
+    _validate_type(entry.get(DEPENDENCY_KEY) or [], list, f"{path}/{DEPENDENCY_KEY}")
+
+    plugins = entry.get(PLUGINS_KEY) or {}
+    _validate_type(plugins, dict, f"{path}/{PLUGINS_KEY}")
+    _validate_type(
+        plugins.get("parallel_validation", False), bool, f"{path}/{PLUGINS_KEY}/parallel_validation"
+    )
+    for stage in _PLUGIN_STAGES & plugins.keys():
+        stage_path = f"{path}/{PLUGINS_KEY}/{stage}"
+        _validate_type(plugins[stage], list, stage_path)
+        for plugin in plugins[stage]:
+            if not isinstance(plugin, dict) or len(plugin) != 1:
+                raise ConfigurationHandlerException(
+                    f"Invalid plugin entry in {stage_path}: {plugin}. Expected a single plugin "
+                    "name with its (optional) arguments."
+                )
+
+
+def _validate_release_date(release_date: Any, path: str):
+    """Validates, that the release-date is either a date, as parsed by yaml for unquoted dates, or
+    a string in the ISO format YYYY-MM-DD. Timestamps and other ISO formats, such as 20240131, are
+    rejected, as the release-date is written verbatim into the changelog entries.
+
+    Args:
+        release_date: value of the release-date parameter.
+        path: path of the release-date parameter within the configuration file.
+    Raises:
+        ConfigurationHandlerException: if the release-date is neither a date nor a string in the
+            format YYYY-MM-DD.
+    """
+    if isinstance(release_date, datetime.datetime):
+        raise ConfigurationHandlerException(
+            f"Invalid configuration parameter: {path}. Expected a date 'YYYY-MM-DD', got the "
+            f"timestamp: {release_date!r}"
+        )
+    _validate_type(release_date, (datetime.date, str), path)
+    if isinstance(release_date, str):
+        try:
+            is_valid = datetime.date.fromisoformat(release_date).isoformat() == release_date
+        except ValueError:
+            is_valid = False
+        if not is_valid:
+            raise ConfigurationHandlerException(
+                f"Invalid configuration parameter: {path}. Expected an ISO date 'YYYY-MM-DD', "
+                f"got: {release_date!r}"
+            )
+
+
+def _validate_type(value: Any, expected_type: Union[type, tuple[type, ...]], path: str):
+    """Validates, that the configuration parameter has the expected type.
+
+    Args:
+        value: value of the configuration parameter.
+        expected_type: expected type (or tuple of types) of the configuration parameter.
+        path: path of the configuration parameter within the configuration file.
+    Raises:
+        ConfigurationHandlerException: if the configuration parameter has an invalid type.
+    """
+    if not isinstance(value, expected_type):
+        expected_types = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+        type_names = " or ".join(f"'{elem.__name__}'" for elem in expected_types)
+        raise ConfigurationHandlerException(
+            f"Invalid configuration parameter: {path}. Expected type {type_names}, got: {value!r}"
+        )
+
+
 def build_release_entries(release_entries_raw: dict) -> list[ReleaseEntry]:
     """Takes the raw release-entries and converts them into a list of the ReleaseEntry
     data-structures.
@@ -204,40 +393,39 @@ def build_release_entries(release_entries_raw: dict) -> list[ReleaseEntry]:
         a list of unsorted release-entries.
     """
 
-    # add name_key
-    for key in release_entries_raw:
-        release_entries_raw[key][REPOSITORY_NAME_KEY] = key
+    # Resolve the (generated) constructors once, instead of for every release-entry.
+    build_public_entry = PublicReleaseEntry.from_dict
+    build_private_entry = PrivateReleaseEntry.from_dict
+    build_plugin_entries = PluginEntries.from_dict
 
-    # Read-In Public Release Entries
-    public_entries = {
-        key: PublicReleaseEntry.from_dict(values) for key, values in release_entries_raw.items()
-    }
+    # Read-In Public Release Entries and Plugins
+    public_entries = {}
+    plugins = {}
+    for key, entry in release_entries_raw.items():
+        entry[REPOSITORY_NAME_KEY] = key
+        public_entries[key] = build_public_entry(entry)
+        plugins[key] = build_plugin_entries(entry.pop(PLUGINS_KEY, None) or {})
 
+    # Dependencies are resolved after all public-entries are known, as they can reference entries
+    # that are declared later in the configuration.
     release_entries = []
     for key, entry in release_entries_raw.items():
 
-        # Read-In Plugins
-        plugin_entries = (
-            release_entries_raw[key].pop(PLUGINS_KEY)
-            if PLUGINS_KEY in entry and entry[PLUGINS_KEY] is not None
-            else {}
-        )
-        plugins = PluginEntries.from_dict(plugin_entries)
-
         # Update dependencies to public-entries
-        if DEPENDENCY_KEY in release_entries_raw[key]:
-            try:
-                entry[DEPENDENCY_KEY] = {dep: public_entries[dep] for dep in entry[DEPENDENCY_KEY]}
-            except KeyError as error:
-                raise ConfigurationHandlerException(
-                    f"Missing dependency keys for repository: {public_entries[key].name}. Please "
-                    "add all dependencies to the release-configuration YAML."
-                ) from error
+        try:
+            entry[DEPENDENCY_KEY] = {
+                dep: public_entries[dep] for dep in entry.get(DEPENDENCY_KEY) or ()
+            }
+        except KeyError as error:
+            raise ConfigurationHandlerException(
+                f"Missing dependency keys for repository: {key}. Please "
+                "add all dependencies to the release-configuration YAML."
+            ) from error
 
         # Read-In Private Release Entries
-        private = PrivateReleaseEntry.from_dict(entry)
+        private = build_private_entry(entry)
 
-        release_entries.append(ReleaseEntry(key, public_entries[key], private, plugins))
+        release_entries.append(ReleaseEntry(key, public_entries[key], private, plugins[key]))
 
     return release_entries
 
@@ -253,21 +441,63 @@ def topological_sort(release_entries: list[ReleaseEntry]) -> list[ReleaseEntry]:
         list of dependency-sorted release-entries.
     """
 
-    graph = {}
-    release_entry_lut = {}
-    for release_entry in release_entries:
-        graph[release_entry.name] = set(
-            [elem.name for elem in release_entry.private.dependencies.values()]
-        )
-        release_entry_lut[release_entry.name] = release_entry
-    sorted_entry_names = graphlib.TopologicalSorter(graph).static_order()
+    # Without any dependencies, the given order is already sorted.
+    sorted_entries = list(release_entries)
+    if any(release_entry.private.dependencies for release_entry in release_entries):
+        graph = {}
+        release_entry_lut = {}
+        for release_entry in release_entries:
+            graph[release_entry.name] = {
+                elem.name for elem in release_entry.private.dependencies.values()
+            }
+            release_entry_lut[release_entry.name] = release_entry
+        sorted_entry_names = graphlib.TopologicalSorter(graph).static_order()
+        try:
+            sorted_entries = list(map(release_entry_lut.__getitem__, sorted_entry_names))
+        except graphlib.CycleError as error:
+            raise ConfigurationHandlerException(
+                f"Failed to perform topological sort due to error: {str(error)}"
+                "NOTE: No circular relations allowed."
+            ) from error
+    logger.info("Successfully sorted release-entries: %s", [entry.name for entry in sorted_entries])
+
+    return sorted_entries
+
+
+def group_by_dependency_level(release_entries: list[ReleaseEntry]) -> list[list[ReleaseEntry]]:
+    """Groups the release-entries into dependency levels. Release-entries of a level solely depend on
+    release-entries of previous levels, so that the release-entries within a level are independent
+    of each other.
+
+    Args:
+        release_entries: list of release-entries.
+    Returns:
+        list of dependency levels, each containing the release-entries in their given order.
+    """
+
+    entry_indices = {release_entry.name: idx for idx, release_entry in enumerate(release_entries)}
+    sorter = graphlib.TopologicalSorter(
+        {
+            release_entry.name: {elem.name for elem in release_entry.private.dependencies.values()}
+            for release_entry in release_entries
+        }
+    )
     try:
-        sorted_entries = [release_entry_lut[name] for name in sorted_entry_names]
+        sorter.prepare()
     except graphlib.CycleError as error:
         raise ConfigurationHandlerException(
             f"Failed to perform topological sort due to error: {str(error)}"
             "NOTE: No circular relations allowed."
         ) from error
-    logger.info("Successfully sorted release-entries: %s", sorted_entry_names)
 
-    return sorted_entries
+    levels = []
+    while sorter.is_active():
+        ready_names = sorter.get_ready()
+        sorter.done(*ready_names)
+        levels.append(
+            [
+                release_entries[entry_indices[name]]
+                for name in sorted(ready_names, key=entry_indices.__getitem__)
+            ]
+        )
+    return levels
@@ -14,9 +14,11 @@ SPDX-License-Identifier: MIT
 """
 
 import logging
+import os
 import pathlib
 import shutil
 from dataclasses import dataclass
+from typing import Optional
 
 import git
 import git.exc
@@ -25,6 +27,10 @@ from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntr
 
 logger = logging.getLogger(__name__)
 
+# Environment variable that allows to disable partial clones, e.g., if the remote does not support
+# them or plugins require all file contents of the history.
+PARTIAL_CLONE_ENV_VARIABLE = "ERA_PARTIAL_CLONE"
+
 
 @dataclass
 class BranchNames:
@@ -52,24 +58,29 @@ class GitHandler:
             release_entry.public.main_branch, release_entry.public.stable_branch
         )
 
-        self._clone_repository()
-        self._repository = git.Repo.init(str(self._repository_dir))
-        self._repository.config_writer().set_value(
-            "user", "name", self._global_config.git_user_name
-        ).release()
-        self._repository.config_writer().set_value(
-            "user", "email", self._global_config.git_user_email
-        ).release()
+        self._repository = self._clone_repository()
+        self._origin = self._repository.remote(name="origin")
+        with self._repository.config_writer() as config_writer:
+            config_writer.set_value("user", "name", self._global_config.git_user_name)
+            config_writer.set_value("user", "email", self._global_config.git_user_email)
 
     def checkout_release_branch(self):
         """Checks-out the 'release' branch originating from the local the 'main'-branch."""
-        self._repository.git.switch(self._branches.main)
-        self._repository.git.checkout("-b", self._branches.release)
+        self._checkout_new_branch(self._branches.main, self._branches.release)
 
     def checkout_merge_back_branch(self):
         """Checks-out the 'merge-back' branch originating from the local 'stable'-branch."""
-        self._repository.git.switch(self._branches.stable)
-        self._repository.git.checkout("-b", self._branches.merge_back)
+        self._checkout_new_branch(self._branches.stable, self._branches.merge_back)
+
+    def _checkout_new_branch(self, base_branch: str, new_branch: str):
+        """Checks-out a new branch originating from the given base-branch with a single git command.
+
+        NOTE: If the base-branch solely exists in the remote repository, it is set up locally by
+        switching to it beforehand.
+        """
+        if base_branch not in self._repository.heads:
+            self._repository.git.switch(base_branch)
+        self._repository.git.checkout(base_branch, b=new_branch)
 
     def merge_release_into_stable(self):
         """Merges the local release-branch into the local stable-branch, or initializes the
@@ -86,8 +97,7 @@ class GitHandler:
                 self._branches.release,
                 str(error),
             )
-            self._repository.git.checkout(self._branches.release)
-            self._repository.git.checkout("-b", self._branches.stable)
+            self._repository.git.checkout(self._branches.release, b=self._branches.stable)
 
             if self._global_config.test_run is False:
                 logger.info("Setting up upstream for branch: '%s'.", self._branches.stable)
@@ -119,9 +129,9 @@ class GitHandler:
         logger.info("Commit release_branch: '%s'", self._branches.release)
         self._commit(
             "chore: :white_check_mark: ERA: Modification with the plugin(s): "
-            f"{self._get_plugin_string(self._release_entry.plugins.release_modification)} "
+            f"{self._release_entry.plugins.release_modification_names} "
             "and Validation with the plugin(s): "
-            f"{self._get_plugin_string(self._release_entry.plugins.release_validation)}"
+            f"{self._release_entry.plugins.release_validation_names}"
         )
 
     def commit_stable(self):
@@ -139,22 +149,26 @@ class GitHandler:
         logger.info("Commit merge-back-branch: '%s'", self._branches.merge_back)
         self._commit(
             "chore: :wastebasket: ERA: Preparation for merging back into main with the plugin(s): "
-            f"{self._get_plugin_string(self._release_entry.plugins.merge_back_finalization)}"
+            f"{self._release_entry.plugins.merge_back_finalization_names}"
         )
 
-    def _get_plugin_string(self, plugins: list[dict[str, dict]]):
-        """Allows to generate a string for all"""
-        return ", ".join(", ".join(plugin.keys()) for plugin in plugins)
+    def _clone_repository(self) -> git.Repo:
+        """Clones the repository specified in the configuration file.
 
-    def _clone_repository(self):
-        """Clones the repository specified in the configuration file."""
+        Returns:
+            the cloned repository.
+        """
 
         self._setup_directory(self._repository_dir)
 
-        logger.info("Cloning: %s", self._release_entry.name)
-        git.Repo.clone_from(
+        # A blob-less clone contains the full commit history required for merging, but solely
+        # downloads the file contents of the checked out commits.
+        partial_clone = os.getenv(PARTIAL_CLONE_ENV_VARIABLE, "true").lower() != "false"
+        logger.info("Cloning: %s (partial clone: %s)", self._release_entry.name, partial_clone)
+        return git.Repo.clone_from(
             url=self._release_entry.public.url,
             to_path=str(self._repository_dir),
+            multi_options=["--filter=blob:none"] if partial_clone else None,
         )
 
     def _setup_directory(self, repository_dir: pathlib.Path):
@@ -168,14 +182,35 @@ class GitHandler:
         """Stages all changes and commits with the given commit-message."""
 
         self._repository.git.add(all=True)
-        self._repository.commit()
         self._repository.index.commit(message)
 
+    @classmethod
+    def remote_tag_exists(cls, url: str, tag: Optional[str]) -> bool:
+        """Validates if the tag is already existing in the remote repository without cloning it.
+
+        Args:
+            url: url of the remote repository.
+            tag: tag to look up.
+        Returns:
+            True, if the tag exists in the remote repository. False, if it does not exist, or the
+            remote repository cannot be queried.
+        """
+        if not tag:
+            return False
+
+        try:
+            remote_tags = git.cmd.Git().ls_remote("--tags", url, f"refs/tags/{tag}")
+        except git.exc.GitCommandError as error:
+            logger.debug("Unable to look up remote tag %s of %s. Error: %s", tag, url, str(error))
+            return False
+        return bool(remote_tags.strip())
+
     def tag_exists(self):
         """Validates if the tag is already existing in the"""
 
-        if self._release_entry.public.version in self._repository.tags:
-            logger.warning("Tag %s already existing.", self._release_entry.public.version)
+        version = self._release_entry.public.version
+        if version in self._repository.tags:
+            logger.warning("Tag %s already existing.", version)
             return True
         return False
 
@@ -185,7 +220,7 @@ class GitHandler:
         logger.info("Removing Existing Tag: %s.", tag)
 
         self._repository.git.tag("-d", tag)  # Delete locally
-        self._repository.remote(name="origin").push(refspec=f":{tag}")
+        self._origin.push(refspec=f":{tag}")
 
     def _tag_stable(self):
         """tags the repository (locally and remote)."""
@@ -193,39 +228,29 @@ class GitHandler:
             return
 
         tag = self._release_entry.public.version
+        stable_branch = self._release_entry.public.stable_branch
         if self.tag_exists():
             self._remove_tag(tag)
 
-        logger.info(
-            "Creating tag: %s for branch: %s", tag, self._release_entry.public.stable_branch
-        )
+        logger.info("Creating tag: %s for branch: %s", tag, stable_branch)
         self._repository.create_tag(
-            tag,
-            ref=self._release_entry.public.stable_branch,
-            message=self._release_entry.private.tag_message,
+            tag, ref=stable_branch, message=self._release_entry.private.tag_message
         )
 
-        origin = self._repository.remote(name="origin")
-        origin.push(tag)
-        logger.info(
-            "Successfully pushed the tag: %s for branch: %s",
-            tag,
-            self._release_entry.public.stable_branch,
-        )
+        self._origin.push(tag)
+        logger.info("Successfully pushed the tag: %s for branch: %s", tag, stable_branch)
 
     def _push_branch_to_remote(self, branch: str):
         """Pushes the given branch to the remote repository."""
 
-        logger.info("Pushing branch '%s' of repository '%s'", branch, self._release_entry.name)
+        name = self._release_entry.name
+        logger.info("Pushing branch '%s' of repository '%s'", branch, name)
         self._repository.git.switch(branch)
-        origin = self._repository.remote(name="origin")
-        push_info_list = origin.push()
+        push_info_list = self._origin.push()
         for push_info in push_info_list:
             logger.info(push_info.summary)
         push_info_list.raise_if_error()  # type: ignore [operator]
-        logger.info(
-            "Successfully pushed branch '%s' of repository '%s'.", branch, self._release_entry.name
-        )
+        logger.info("Successfully pushed branch '%s' of repository '%s'.", branch, name)
 
     def push_changes_to_remote(self):
         """Pushes the changes of the main- and stable-branch to the remote repository. And Tags the
@@ -233,11 +258,12 @@ class GitHandler:
 
         NOTE: Local changes must be already committed before calling this function.
         """
+        branches = self._branches
         if self._repository.is_dirty(untracked_files=True):
             logger.error("Found un-staged changes in the repository.")
 
-        self._push_branch_to_remote(self._branches.main)
+        self._push_branch_to_remote(branches.main)
 
-        self._push_branch_to_remote(self._branches.stable)
+        self._push_branch_to_remote(branches.stable)
 
         self._tag_stable()
@@ -15,10 +15,16 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+import functools
 import importlib.metadata
 import logging
 import pathlib
-from typing import Optional
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.utils.logging_wrapper import format_minor, format_sub_chapter
@@ -28,11 +34,52 @@ logger = logging.getLogger(__name__)
 MODIFICATION_ENTRYPOINT_GROUP = "repository.modification"
 VALIDATION_ENTRYPOINT_GROUP = "repository.validation"
 
+# The log messages are formatted once on import. Their %-style placeholders are solely interpolated
+# by the logger, if the log level is enabled.
+_EXECUTE_PLUGIN_MESSAGE = format_minor("Executing %s with the argument: %s")
+
 
 class PluginExecutorError(Exception):
     """For exceptions during actions of the PluginExecutor."""
 
 
+class PluginRequest(NamedTuple):
+    """Plugin requested by the release-configuration with the key-word arguments for its run
+    method."""
+
+    name: str
+    key_word_args: Optional[dict]
+
+
+class _PreparedPlugin(NamedTuple):
+    """Plugin with its loaded entry-point class, that is ready to be executed."""
+
+    name: str
+    entry_point_class: type
+    key_word_args: Optional[dict]
+
+
+class _Stage(NamedTuple):
+    """Plugin stage of the release process."""
+
+    entry_point_group: str
+    message: str
+
+
+# Plugin stages by the names of their plugin entries in the release-configuration.
+_STAGES = {
+    "release_modification": _Stage(
+        MODIFICATION_ENTRYPOINT_GROUP, format_sub_chapter("Modify Release Branch of '%s'")
+    ),
+    "release_validation": _Stage(
+        VALIDATION_ENTRYPOINT_GROUP, format_sub_chapter("Validate Release Branch of '%s'")
+    ),
+    "merge_back_finalization": _Stage(
+        MODIFICATION_ENTRYPOINT_GROUP, format_sub_chapter("Finalize Merge-Back Branch of '%s'")
+    ),
+}
+
+
 class PluginExecutor:
     """Executor for the Plugin-Mechanism in ERA."""
 
@@ -42,89 +89,237 @@ class PluginExecutor:
         self._release_entry = release_entry
         self._global_config = global_config
         self._repository_dir = repository_dir
+        # Constructor arguments shared by all plugins of the release entry.
+        self._plugin_arguments = (release_entry, global_config, repository_dir)
+        # The entry-points of both groups are looked up once for all stages.
+        self._entry_points_by_group = {
+            MODIFICATION_ENTRYPOINT_GROUP: _ENTRY_POINT_REGISTRY.modification,
+            VALIDATION_ENTRYPOINT_GROUP: _ENTRY_POINT_REGISTRY.validation,
+        }
+        # Prepared plugins by the names of their stages.
+        self._prepared_stages: Optional[dict[str, list[_PreparedPlugin]]] = None
 
-    def _execute_plugins(
-        self, entry_group: str, requested_entry_points: list[dict[str, Optional[dict]]]
-    ):
-        """Initializes all the requested entry-point classes for the given entry group and executes
-        their run method.
+    def prepare(self):
+        """Validates the requested plugins of all stages and loads their entry-point classes, so
+        that invalid release-configurations fail before any stage is executed, and the stages solely
+        instantiate and run the prepared plugins.
+
+        NOTE: If not called explicitly, the plugins are prepared on the execution of the first
+        stage.
+
+        Raises:
+            PluginExecutorError, if a specified plugin from the release-config.yml is not existing,
+                or a plugin entry does not specify exactly one plugin.
+        """
+        self._prepared_stages = {
+            stage_name: self._prepare_plugins(
+                self._entry_points_by_group[stage.entry_point_group],
+                getattr(self._release_entry.plugins, stage_name),
+            )
+            for stage_name, stage in _STAGES.items()
+        }
+
+    def _prepare_plugins(
+        self,
+        entry_points: Mapping[str, importlib.metadata.EntryPoint],
+        requested_entry_points: list[dict[str, Optional[dict]]],
+    ) -> list[_PreparedPlugin]:
+        """Validates the requested entry-points for the given entry group and loads their classes.
 
         Args:
-            entry_group: entry group of the entry points.
+            entry_points: all installed entry-points of the entry group by their names.
             requested_entry_points: all requested entry-points (classes) that should be executed and
                 an optional dictionary, that will be handed over as a keyword arguments for the
                 entry-points run method.
+        Returns:
+            the prepared plugins in the given order.
         Raises:
-            PluginExecutorError, if the specified plugin from the telematics-config.yml is not
-                existing.
+            PluginExecutorError, if the specified plugin from the release-config.yml is not
+                existing, or a plugin entry does not specify exactly one plugin.
         """
-        # Get a dictionary of all entry points for the given group (specified in the setup.cfg)
-        entry_points = self._get_entry_point_dictionary(entry_group)
-
-        for entry in requested_entry_points:
-            # Get entry-point name and kwargs from release-configuration
-            requested_entry_point, key_word_args = next(iter(entry.items()))
-            # Validate, that entry-point exists
-            if requested_entry_point not in entry_points:
-                error_msg = (
-                    f"Unknown entry-point specified in release-config.yml: {requested_entry_point}."
-                    f" Available entry-points: {entry_points.keys()}"
-                )
-                logger.error(error_msg)
-                raise PluginExecutorError(error_msg)
-            # Load entry-point.
-            entry_point_class = entry_points[requested_entry_point].load()
-            # Instantiate and run entry-point.
-            class_instance = entry_point_class(
-                self._release_entry, self._global_config, self._repository_dir
+        plugin_requests = _parse_plugin_requests(requested_entry_points)
+        # All plugins are validated, before any of them is loaded.
+        unknown_entry_points = [
+            plugin_request.name
+            for plugin_request in plugin_requests
+            if plugin_request.name not in entry_points
+        ]
+        if unknown_entry_points:
+            error_msg = (
+                f"Unknown entry-point(s) specified in release-config.yml: {unknown_entry_points}."
+                f" Available entry-points: {list(entry_points)}"
             )
+            logger.error(error_msg)
+            raise PluginExecutorError(error_msg)
 
-            logger.info(
-                format_minor("Executing %s with the argument: %s"),
-                requested_entry_point,
-                key_word_args,
-            )
+        return [
+            _PreparedPlugin(name, _load_entry_point(entry_points[name]), key_word_args)
+            for name, key_word_args in plugin_requests
+        ]
 
-            if key_word_args is not None:
-                class_instance.run(**key_word_args)
-            else:
-                class_instance.run()
+    def _execute_stage(self, stage_name: str, parallel: bool = False):
+        """Executes all prepared plugins of the given stage.
 
-    def _get_entry_point_dictionary(self, group: str) -> dict[str, importlib.metadata.EntryPoint]:
-        """Returns all entrypoints for the given string in a dictionary.
+        Args:
+            stage_name: name of the plugin entries of the stage in the release-configuration.
+            parallel: if set to True, the plugins are executed concurrently in separate threads.
+                Otherwise, they are executed sequentially in the given order.
+        Raises:
+            PluginExecutorError, if the plugins have not been prepared yet, and the preparation
+                fails.
+        """
+        if self._prepared_stages is None:
+            self.prepare()
+
+        logger.info(_STAGES[stage_name].message, self._release_entry.name)
+        prepared_plugins = self._prepared_stages[stage_name]  # type: ignore [index]
+        if not parallel or len(prepared_plugins) <= 1:
+            for prepared_plugin in prepared_plugins:
+                self._execute_plugin(prepared_plugin)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(prepared_plugins)) as executor:
+            futures = [
+                executor.submit(self._execute_plugin, prepared_plugin)
+                for prepared_plugin in prepared_plugins
+            ]
+        for future in futures:
+            future.result()  # Re-raises exceptions of the plugins
+
+    def _execute_plugin(self, prepared_plugin: _PreparedPlugin):
+        """Initializes the prepared entry-point class and executes its run method.
 
         Args:
-            group: group of entry points.
-        Returns:
-            a dictionary of all installed entry-points.
+            prepared_plugin: the loaded entry-point class and an optional dictionary, that will be
+                handed over as a keyword arguments for the entry-points run method.
         """
-        entry_pts = importlib.metadata.entry_points()[group]
-        return {entry_point.name: entry_point for entry_point in entry_pts}
+        name, entry_point_class, key_word_args = prepared_plugin
+        class_instance = entry_point_class(*self._plugin_arguments)
+
+        logger.info(_EXECUTE_PLUGIN_MESSAGE, name, key_word_args)
+
+        class_instance.run(**(key_word_args or {}))
 
     def modify_release_branch(self):
         """Triggers the execution of all modification-plugins for the release-branch."""
-        logger.info(format_sub_chapter("Modify Release Branch of '%s'"), self._release_entry.name)
-        self._execute_plugins(
-            MODIFICATION_ENTRYPOINT_GROUP,
-            self._release_entry.plugins.release_modification,
-        )
+        self._execute_stage("release_modification")
 
     def validate_release_branch(self):
         """Triggers the execution of all validation plugins for the release-branch."""
-        logger.info(format_sub_chapter("Validate Release Branch of '%s'"), self._release_entry.name)
-
-        self._execute_plugins(
-            VALIDATION_ENTRYPOINT_GROUP,
-            self._release_entry.plugins.release_validation,
+        self._execute_stage(
+            "release_validation", parallel=self._release_entry.plugins.parallel_validation
         )
 
     def finalize_merge_back_branch(self):
         """Triggers the execution of all modification-plugins for the merge-back-branch."""
-        logger.info(
-            format_sub_chapter("Finalize Merge-Back Branch of '%s'"), self._release_entry.name
-        )
+        self._execute_stage("merge_back_finalization")
 
-        self._execute_plugins(
-            MODIFICATION_ENTRYPOINT_GROUP,
-            self._release_entry.plugins.merge_back_finalization,
-        )
+
+def _parse_plugin_requests(
+    requested_entry_points: list[dict[str, Optional[dict]]],
+) -> list[PluginRequest]:
+    """Converts the plugin entries of the release-configuration, i.e., single-key dictionaries, into
+    plugin requests before any plugin is executed.
+
+    Args:
+        requested_entry_points: all requested entry-points (classes) with an optional dictionary of
+            key-word arguments for their run method.
+    Returns:
+        the plugin requests in the given order.
+    Raises:
+        PluginExecutorError, if a plugin entry does not specify exactly one plugin.
+    """
+    plugin_requests = []
+    for entry in requested_entry_points:
+        try:
+            ((name, key_word_args),) = entry.items()
+        except ValueError as error:
+            error_msg = (
+                "Each plugin entry in release-config.yml must specify exactly one entry-point. "
+                f"Found: {list(entry)}"
+            )
+            logger.error(error_msg)
+            raise PluginExecutorError(error_msg) from error
+        plugin_requests.append(PluginRequest(name, key_word_args))
+    return plugin_requests
+
+
+# The installed entry-points are iterated once and bucketed by their groups. Since Python 3.12, a
+# flat sequence of entry-points is returned, whereas older versions return a dictionary of groups.
+# The distinction is made once on import.
+if sys.version_info >= (3, 12):
+
+    def _get_entry_points_by_group() -> dict[str, dict[str, importlib.metadata.EntryPoint]]:
+        """Returns the entry-points of all installed distributions by their groups and names.
+
+        Returns:
+            the installed entry-points.
+        """
+        entry_points_by_group: dict[str, dict[str, importlib.metadata.EntryPoint]] = {}
+        for entry_point in importlib.metadata.entry_points():
+            entry_points_by_group.setdefault(entry_point.group, {})[entry_point.name] = entry_point
+        return entry_points_by_group
+
+else:
+
+    def _get_entry_points_by_group() -> dict[str, dict[str, importlib.metadata.EntryPoint]]:
+        """Returns the entry-points of all installed distributions by their groups and names.
+
+        Returns:
+            the installed entry-points.
+        """
+        return {
+            group: {entry_point.name: entry_point for entry_point in entry_pts}
+            for group, entry_pts in importlib.metadata.entry_points().items()
+        }
+
+
+class _EntryPointRegistry:
+    """Installed entry-points of the plugin groups by their names, which are shared by all
+    PluginExecutors. The installed distributions are scanned once per process for all groups. The
+    scan is guarded by a lock, so that concurrently released repositories do not scan them in
+    parallel.
+
+    NOTE: the entry-points are shared by all callers, so that they are solely provided as read-only
+    mappings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scanned_entry_points: Optional[
+            dict[str, dict[str, importlib.metadata.EntryPoint]]
+        ] = None
+
+    @cached_property
+    def modification(self) -> Mapping[str, importlib.metadata.EntryPoint]:
+        """Entry-points of the modification plugins."""
+        return MappingProxyType(self._entry_points_by_group.get(MODIFICATION_ENTRYPOINT_GROUP, {}))
+
+    @cached_property
+    def validation(self) -> Mapping[str, importlib.metadata.EntryPoint]:
+        """Entry-points of the validation plugins."""
+        return MappingProxyType(self._entry_points_by_group.get(VALIDATION_ENTRYPOINT_GROUP, {}))
+
+    @property
+    def _entry_points_by_group(self) -> dict[str, dict[str, importlib.metadata.EntryPoint]]:
+        """Entry-points of all groups, which are scanned on first use."""
+        with self._lock:
+            if self._scanned_entry_points is None:
+                self._scanned_entry_points = _get_entry_points_by_group()
+            return self._scanned_entry_points
+
+
+_ENTRY_POINT_REGISTRY = _EntryPointRegistry()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_entry_point(entry_point: importlib.metadata.EntryPoint) -> type:
+    """Loads the class of the entry-point once per process, as plugins are used by several stages
+    and release entries.
+
+    Args:
+        entry_point: the entry-point to load.
+    Returns:
+        the plugin class.
+    """
+    return entry_point.load()
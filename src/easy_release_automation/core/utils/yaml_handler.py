@@ -14,21 +14,45 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
+from collections import OrderedDict
 from typing import Optional
 
-import yaml
-
 COMP_NAME = "YamlHandler"
 
 logger = logging.getLogger(__name__)
 
+# Parsed yaml-files keyed by (absolute path, modification time, size). Bounded to the most recently
+# used entries.
+_PARSE_CACHE_SIZE = 16
+_PARSE_CACHE: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+
 
 class InvalidConfPathError(Exception):
     """Exception Class for cases where the configuration-path is invalid"""
 
 
+@functools.lru_cache(maxsize=None)
+def _get_safe_loader() -> type:
+    """Imports PyYAML on first use and returns the fastest available safe loader. The libyaml based
+    loader parses significantly faster than the pure-python one.
+
+    Returns:
+        the yaml loader class.
+    """
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore [assignment]
+
+        logger.warning("LibYAML is not available. Falling back to the pure-python SafeLoader.")
+
+    return SafeLoader
+
+
 class YamlHandler:
     @classmethod
     def get_config(cls, default_path: str, env_variable_name: Optional[str] = None) -> dict:
@@ -58,6 +82,8 @@ class YamlHandler:
     @classmethod
     def _read_config(cls, path: str) -> dict:
         """Reads the yaml-file for the given path. Includes error handling if file-path is invalid.
+        Unchanged files are not parsed again, but a copy of the previously parsed content is
+        returned, as callers are allowed to modify the configuration.
 
         Params:
             path: path to the yaml-file.
@@ -66,17 +92,35 @@ class YamlHandler:
         Raises:
             InvalidConfPathError if file-path is invalid
         """
-        if not os.path.isfile(path):
+        import yaml
+
+        try:
+            config_stream = open(path, "rb")
+        except (FileNotFoundError, IsADirectoryError) as error:
             error_msg = f"YamlHandler: No yaml-file found. Path: {path}"
-            raise InvalidConfPathError(error_msg)
-
-        with open(path, "r", encoding="utf-8") as config_stream:
-            try:
-                config = yaml.safe_load(config_stream)
-            except yaml.YAMLError as error:
-                error_msg = (
-                    f"YamlHandler: - Unable to read Yaml file {path}. Potentially corrupted Yaml."
-                )
-                raise InvalidConfPathError(error_msg) from error
-
-        return config
+            raise InvalidConfPathError(error_msg) from error
+
+        with config_stream:
+            stat_result = os.fstat(config_stream.fileno())
+            cache_key = (os.path.abspath(path), stat_result.st_mtime_ns, stat_result.st_size)
+            if cache_key in _PARSE_CACHE:
+                logger.debug("Using cached configuration for: %s", path)
+                _PARSE_CACHE.move_to_end(cache_key)
+                return copy.deepcopy(_PARSE_CACHE[cache_key])
+
+            # Hand the raw bytes to the parser, so that the decoding is done by libyaml directly.
+            config_data = config_stream.read()
+
+        try:
+            config = yaml.load(config_data, Loader=_get_safe_loader())
+        except yaml.YAMLError as error:
+            error_msg = (
+                f"YamlHandler: - Unable to read Yaml file {path}. Potentially corrupted Yaml."
+            )
+            raise InvalidConfPathError(error_msg) from error
+
+        _PARSE_CACHE[cache_key] = config
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+        return copy.deepcopy(config)
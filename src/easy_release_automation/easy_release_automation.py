@@ -13,21 +13,31 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
 import sys
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
-
-from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry, get_configuration
+from typing import TYPE_CHECKING, Optional
+
+from easy_release_automation.core.configuration import (
+    GlobalConfig,
+    ReleaseEntry,
+    get_configuration,
+    group_by_dependency_level,
+)
 from easy_release_automation.utils import logging_wrapper
-from easy_release_automation.core.git_handler import GitHandler
 from easy_release_automation.utils.logging_wrapper import format_chapter, format_major
 from easy_release_automation.core.plugin_executor import PluginExecutor
 
+if TYPE_CHECKING:
+    from easy_release_automation.core.git_handler import GitHandler
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,19 +73,20 @@ def perform_local_release_steps(git_handler: GitHandler, plugin_executer: Plugin
     git_handler.merge_merge_back_into_main()
 
 
-def skip_repository(
-    git_handler: GitHandler, global_tag_policy: str, local_tag_policy: Optional[str]
-) -> bool:
-    """Validates if a repository should be skipped and can erase the tag if it should be
-    overwritten."""
+def resolve_tag_policy(global_tag_policy: str, local_tag_policy: Optional[str]) -> str:
+    """Returns the active tag-policy. The local tag-policy overrides the global tag-policy."""
 
     logger.debug(
-        "Validate Skipping. global-tag-policy: %s, local-tag-policy %s",
+        "Resolve tag-policy. global-tag-policy: %s, local-tag-policy %s",
         global_tag_policy,
         local_tag_policy,
     )
+    return global_tag_policy if local_tag_policy is None else local_tag_policy
+
 
-    tag_policy = global_tag_policy if local_tag_policy is None else local_tag_policy
+def skip_repository(git_handler: GitHandler, tag_policy: str) -> bool:
+    """Validates if a repository should be skipped and can erase the tag if it should be
+    overwritten."""
 
     if git_handler.tag_exists():
         logger.info("The tag is already existing. Active tag_policy: %s.", tag_policy)
@@ -95,10 +106,24 @@ def perform_release_for_single_entry(
         release_entry: configuration that solely accounts for this single entry.
         repository_dir: directory where the repository is cloned to.
     """
+    # NOTE: GitPython is imported on first use, as its import is comparatively slow.
+    from easy_release_automation.core.git_handler import GitHandler
+
+    public_entry = release_entry.public
+    tag_policy = resolve_tag_policy(global_config.tag_policy, release_entry.private.tag_policy)
+    # Avoid cloning repositories, that are skipped anyway.
+    if tag_policy == "skip" and GitHandler.remote_tag_exists(
+        public_entry.url, public_entry.version
+    ):
+        logger.info("The tag is already existing in the remote repository. Skipping Repository.")
+        return
+
     plugin_executor = PluginExecutor(release_entry, global_config, repository_dir)
+    # Invalid plugin entries are reported before the repository is cloned.
+    plugin_executor.prepare()
     git_handler = GitHandler(release_entry, global_config, repository_dir)
 
-    if skip_repository(git_handler, global_config.tag_policy, release_entry.private.tag_policy):
+    if skip_repository(git_handler, tag_policy):
         logger.info("Skipping Repository.")
         return
 
@@ -119,7 +144,10 @@ def perform_release_for_single_entry(
 
 
 def perform_release_process(
-    work_directory: pathlib.Path, global_config: GlobalConfig, release_entries: list[ReleaseEntry]
+    work_directory: pathlib.Path,
+    global_config: GlobalConfig,
+    release_entries: list[ReleaseEntry],
+    parallel_jobs: int = 1,
 ):
     """Performs the full release process for the given release entries within the
     configuration_path.
@@ -129,20 +157,51 @@ def perform_release_process(
             evaluated.
         global_config: global release configuration
         release_entries: list of repositories to release
+        parallel_jobs: maximum number of repositories released concurrently. Repositories are solely
+            released concurrently, if they do not depend on each other. If set to 1, the
+            repositories are released sequentially in the given order.
     """
 
-    for release_entry in release_entries:
-        if release_entry.private.should_skip:
-            logger.info(format_chapter("Skipping Release for Repository: '%s'"), release_entry.name)
-            continue
-        logger.info(format_chapter("Beginning Release For: '%s'"), release_entry.name)
-
-        repository_dir = work_directory / release_entry.name
-        perform_release_for_single_entry(global_config, release_entry, repository_dir)
+    if parallel_jobs <= 1:
+        for release_entry in release_entries:
+            _perform_release_for_scheduled_entry(work_directory, global_config, release_entry)
+    else:
+        for level in group_by_dependency_level(release_entries):
+            with ThreadPoolExecutor(max_workers=min(len(level), parallel_jobs)) as executor:
+                futures = [
+                    executor.submit(
+                        _perform_release_for_scheduled_entry,
+                        work_directory,
+                        global_config,
+                        release_entry,
+                    )
+                    for release_entry in level
+                ]
+            for future in futures:
+                future.result()  # Re-raises exceptions of the release process
 
     logger.info(format_major("Successfully Built Release for all Repositories."))
 
 
+def _perform_release_for_scheduled_entry(
+    work_directory: pathlib.Path, global_config: GlobalConfig, release_entry: ReleaseEntry
+):
+    """Performs the release process for a single release entry, unless it should be skipped.
+
+    Args:
+        work_directory: directory where the release repositories are cloned to.
+        global_config: global release configuration
+        release_entry: repository to release
+    """
+    if release_entry.private.should_skip:
+        logger.info(format_chapter("Skipping Release for Repository: '%s'"), release_entry.name)
+        return
+    logger.info(format_chapter("Beginning Release For: '%s'"), release_entry.name)
+
+    repository_dir = work_directory / release_entry.name
+    perform_release_for_single_entry(global_config, release_entry, repository_dir)
+
+
 @dataclass
 class CLIArguments:
     """Dataclass for the cli-arguments."""
@@ -152,6 +211,7 @@ class CLIArguments:
     author: Optional[str]
     email: Optional[str]
     global_tag_policy: Optional[str]
+    parallel_jobs: int = 1
 
 
 def parse_cli_args() -> CLIArguments:
@@ -180,6 +240,13 @@ def parse_cli_args() -> CLIArguments:
         help="'skip': skip repository if tag exists, 'ovr': override existing tag. "
         "Overrides tag_policy of the global configuration.",
     )
+    parser.add_argument(
+        "--parallel-jobs",
+        type=int,
+        default=1,
+        help="maximum number of independent repositories that are released concurrently. "
+        "Default: 1 (sequential release).",
+    )
 
     arguments = parser.parse_args()
 
@@ -194,6 +261,7 @@ def parse_cli_args() -> CLIArguments:
         author=arguments.author,
         email=arguments.email,
         global_tag_policy=arguments.global_tag_policy,
+        parallel_jobs=arguments.parallel_jobs,
     )
 
 
@@ -216,7 +284,9 @@ def run_era():
     )
     logging_wrapper.log_release_information(release_entries, global_config)
 
-    perform_release_process(work_directory, global_config, release_entries)
+    perform_release_process(
+        work_directory, global_config, release_entries, parallel_jobs=cli_args.parallel_jobs
+    )
 
 
 def main():
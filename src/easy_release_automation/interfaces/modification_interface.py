@@ -46,7 +46,9 @@ class ModificationInterface(metaclass=ABCMeta):
 
     @abstractmethod
     def run(self, **kwargs):
-        """This method is called by ERA to modify the repository.
+        """This method is called by ERA to modify the repository. Plugins of independent
+        release-entries may run concurrently (see cli-parameter '--parallel-jobs'), so that state
+        shared between plugin instances has to be thread-safe.
 
         Args:
             kwargs: keyword-arguments, that are individual to the implemented method.
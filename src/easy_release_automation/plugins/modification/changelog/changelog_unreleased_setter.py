@@ -21,7 +21,6 @@ from easy_release_automation.interfaces.modification_interface import (
     ModificationException,
     ModificationInterface,
 )
-from easy_release_automation.plugins.modification.regex_replacer import RegexReplacerPlugin
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +40,24 @@ UNRELEASED_SNIPPET: str = """## [Unreleased]
 
 """
 
+# Compiled once on import, as the patterns are applied on every run. The patterns are applied on
+# the raw file content to avoid decoding and encoding the changelog.
+_UNRELEASED_PATTERN = re.compile(UNRELEASED_REGEX.encode())
+_RELEASE_SECTION_PATTERN = re.compile(RELEASE_SECTION_REGEX.encode())
+_UNRELEASED_SNIPPET_BYTES = UNRELEASED_SNIPPET.encode()
+
+
+def _insert_unreleased_snippet(release_section_match: re.Match) -> bytes:
+    """Inserts the [Unreleased] section in front of the matched release section. A function is
+    used as replacement, so that no replacement template has to be parsed.
+
+    Args:
+        release_section_match: match of the latest release section.
+    Returns:
+        the replacement of the match.
+    """
+    return _UNRELEASED_SNIPPET_BYTES + release_section_match.group(1)
+
 
 class ChangelogUnreleasedSetterPlugin(ModificationInterface):
     """Plugin that adds an [Unreleased] section to changelog.md files."""
@@ -51,7 +68,6 @@ class ChangelogUnreleasedSetterPlugin(ModificationInterface):
         """Initializes the ChangelogUnreleasedSetterPlugin"""
         self._release_entry = release_entry
         self._repository_dir = repository_dir
-        self._regex_replacer = RegexReplacerPlugin(release_entry, global_config, repository_dir)
 
     def run(self, file_path_relative: str):
         """The run method adds a [Unreleased] section to the changelog, if it does not exist
@@ -72,28 +88,24 @@ class ChangelogUnreleasedSetterPlugin(ModificationInterface):
         """
 
         file_path = self._repository_dir / file_path_relative
-        unreleased_matcher = self._regex_replacer.compile_regex(UNRELEASED_REGEX)
 
         try:
-            with file_path.open("r", newline="") as in_file:
-                content = in_file.read()
+            content = file_path.read_bytes()
         except FileNotFoundError as error:
             raise ModificationException(f"{file_path} not found.") from error
 
-        unreleased_match = re.search(unreleased_matcher, content)
-        if unreleased_match is not None:
+        if _UNRELEASED_PATTERN.search(content) is not None:
             logger.info("%s already contains an [Unreleased] section, returning now.", file_path)
             return  # there's already a [Unreleased] section -> do nothing
 
-        replacement = UNRELEASED_SNIPPET + r"\g<1>"
-        try:
-            self._regex_replacer.run(
-                file_path_relative, RELEASE_SECTION_REGEX, replacement, replacement_count=1
-            )
-        except ModificationException:
+        # Both cases are handled on the already read content, so that the file is written once.
+        new_content, replacement_count = _RELEASE_SECTION_PATTERN.subn(
+            _insert_unreleased_snippet, content, count=1
+        )
+        if replacement_count == 0:
             logger.info(
                 "%s does not contain any release entry. Appending at end", file_path_relative
             )
-            self._regex_replacer.run(
-                file_path_relative, r"\Z", "\n\n" + UNRELEASED_SNIPPET, replacement_count=1
-            )
+            new_content = content + b"\n\n" + _UNRELEASED_SNIPPET_BYTES
+
+        file_path.write_bytes(new_content)
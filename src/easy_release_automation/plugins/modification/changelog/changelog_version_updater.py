@@ -15,7 +15,7 @@ SPDX-License-Identifier: MIT
 
 import logging
 import pathlib
-from datetime import datetime
+import re
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import ModificationInterface
@@ -25,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 UNRELEASED_REGEX = r"(?m)^## \[Unreleased\]$"
 
+# Compiled once on import and shared by all plugin instances. The pattern is applied on the raw file
+# content to avoid decoding and encoding the changelog.
+_UNRELEASED_PATTERN = re.compile(UNRELEASED_REGEX.encode())
+
 
 class ChangelogVersionUpdaterPlugin(ModificationInterface):
     """Plugin that allows to update the version in changelog.md files."""
@@ -34,6 +38,7 @@ class ChangelogVersionUpdaterPlugin(ModificationInterface):
     ):
         """Initializes the ChangelogVersionUpdaterPlugin"""
         self._release_entry = release_entry
+        self._global_config = global_config
         self._repository_dir = repository_dir
         self._regex_replacer = RegexReplacerPlugin(release_entry, global_config, repository_dir)
 
@@ -45,6 +50,6 @@ class ChangelogVersionUpdaterPlugin(ModificationInterface):
             version: the new version.
         """
 
-        replacement = f"## [{version}] - {datetime.today().strftime('%Y-%m-%d')}"
+        replacement = f"## [{version}] - {self._global_config.release_date}"
         logger.info("replacing '## [Unreleased]' with '%s' in changelog", replacement)
-        self._regex_replacer.run(file_path_relative, UNRELEASED_REGEX, replacement)
+        self._regex_replacer.run(file_path_relative, _UNRELEASED_PATTERN, replacement)
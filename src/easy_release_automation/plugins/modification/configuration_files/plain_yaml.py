@@ -0,0 +1,195 @@
+"""Plain YAML fast-path.
+
+Description:
+    Round-trip parsing with ruamel.yaml preserves comments, anchors and the formatting of scalars,
+    but is slow for larger files. Plain YAML files, where nothing has to be preserved, are parsed
+    and dumped with the LibYAML bindings of PyYAML instead. For all other files, the module provides
+    a reusable ruamel.yaml round-trip parser, and update_file applies an update with the matching
+    parser. The updated configuration of a plain file is solely dumped with PyYAML, if its result
+    is plain as well.
+
+    A file is considered plain, if it is a mapping in block style without comments, anchors,
+    aliases, tags, directives, block scalars, quoted scalars, escape sequences, null values, blank
+    or folded lines, and without plain scalars, that are interpreted differently by YAML 1.1
+    (PyYAML) and YAML 1.2 (ruamel.yaml), or whose formatting is not preserved by PyYAML (integers
+    with prefixes or leading zeros, floats, timestamps). For all other files, the result of PyYAML
+    would differ from the round-trip result of ruamel.yaml.
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pathlib
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import yaml
+
+if TYPE_CHECKING:
+    import ruamel.yaml
+
+try:
+    from yaml import CSafeDumper, CSafeLoader
+except ImportError:
+    HAS_LIBYAML = False
+else:
+    HAS_LIBYAML = True
+
+logger = logging.getLogger(__name__)
+
+# The round-trip parser is not thread-safe, so that one instance is kept per thread.
+_thread_local = threading.local()
+
+# Characters introducing comments, anchors, aliases, tags, directives, flow collections, block
+# scalars, quoted scalars, escape sequences and null values.
+_NON_PLAIN_CHARACTER_PATTERN = re.compile(rb"""[#&*!%[{|>~"'\\]""")
+
+# Both emitters fold longer lines, but at different positions.
+_MAX_LINE_LENGTH = 80
+
+# Plain scalars (keys or values), that are resolved differently by YAML 1.1 and YAML 1.2, or that
+# are not dumped as they were written: booleans such as yes/no/on/off, integers with leading zeros
+# or underscores, hexadecimal, octal and binary integers, sexagesimal integers, floats, timestamps,
+# null and the value key '='.
+_AMBIGUOUS_SCALAR_PATTERN = re.compile(rb"""(?imx)
+    (?:^|[-:])[ \t]*
+    (?:
+        y|n|yes|no|on|off|null|=
+        |[-+]?0[\d_obx]\w*|[-+]?\d[\d_]*(?::[0-5]?\d)+|[-+]?\d[\d_]*_[\d_]*
+        |[-+]?(?:\d[\d_]*)?\.\d*(?:e[-+]?\d+)?|[-+]?\d+e[-+]?\d+
+        |\d{4}-\d\d?-\d\d?(?:[Tt \t].*)?
+    )
+    [ \t]*(?:$|:)
+    """)
+
+
+def get_round_trip_yaml() -> ruamel.yaml.YAML:
+    """Returns the round-trip parser of the current thread. The parser is set up once per thread, as
+    its construction registers all representers and constructors. ruamel.yaml is solely imported,
+    if a file is not plain.
+
+    Returns:
+        the ruamel.yaml round-trip parser.
+    """
+    round_trip_yaml = getattr(_thread_local, "round_trip_yaml", None)
+    if round_trip_yaml is None:
+        import ruamel.yaml
+
+        round_trip_yaml = _thread_local.round_trip_yaml = ruamel.yaml.YAML()
+    return round_trip_yaml
+
+
+def load(yaml_data: bytes) -> Optional[dict]:
+    """Parses the yaml-data with the LibYAML loader, if it is plain.
+
+    Args:
+        yaml_data: raw content of the yaml-file.
+    Returns:
+        the parsed configuration, or None, if LibYAML is not available or the yaml-data is not
+        plain. An empty file results in an empty configuration. Invalid yaml-data is left to
+        the round-trip parser for the error handling.
+    """
+    if not _is_plain(yaml_data):
+        return None
+
+    try:
+        config = yaml.load(yaml_data, Loader=CSafeLoader)
+    except yaml.YAMLError:
+        return None
+    if config is None:
+        return {}
+    if not isinstance(config, dict) or _contains_null(config):
+        return None
+    return config
+
+
+def dump(config: dict) -> str:
+    """Dumps the configuration with the LibYAML dumper in the style of ruamel.yaml, i.e., block
+    style, unicode characters and the key order are preserved.
+
+    Args:
+        config: the configuration to dump.
+    Returns:
+        the yaml string.
+    """
+    return yaml.dump(config, Dumper=CSafeDumper, sort_keys=False, allow_unicode=True)
+
+
+def update_file(file_path: pathlib.Path, update: Callable[[dict], Optional[dict]]):
+    """Updates the configuration of the yaml-file, and rewrites the file, if it is changed. Plain
+    files are parsed and dumped with LibYAML, all other files with the round-trip parser.
+
+    Args:
+        file_path: absolute path to the yaml-file.
+        update: function, that receives the existing configuration, and returns the updated
+            configuration, or None, if the configuration is already up to date.
+    """
+    yaml_data = file_path.read_bytes()
+
+    # Plain files are parsed with LibYAML, as there is nothing to preserve for the round-trip.
+    existing_config = load(yaml_data)
+    is_plain = existing_config is not None
+    if existing_config is None:
+        existing_config = get_round_trip_yaml().load(yaml_data)
+        existing_config = existing_config if existing_config is not None else {}
+
+    logger.debug("Existing Configuration: \n%s\n", existing_config)
+    updated_config = update(existing_config)
+    if updated_config is None:
+        logger.info("Configuration file %s is already up to date.", file_path)
+        return
+
+    yaml_string = dump(updated_config) if is_plain else None
+    # The updated values have to be plain as well, e.g., the string '1e3' is dumped unquoted by
+    # PyYAML, but read back as float by YAML 1.2.
+    if yaml_string is None or load(yaml_string.encode()) != updated_config:
+        yaml_stream = io.StringIO()
+        get_round_trip_yaml().dump(updated_config, yaml_stream)
+        yaml_string = yaml_stream.getvalue()
+    file_path.write_text(yaml_string)
+
+
+def _is_plain(yaml_data: bytes) -> bool:
+    """Checks, if the yaml-data can be updated via the fast-path without losing information.
+
+    Args:
+        yaml_data: raw content of the yaml-file.
+    Returns:
+        True, if LibYAML is available and the yaml-data is plain.
+    """
+    if not HAS_LIBYAML:
+        return False
+    if _NON_PLAIN_CHARACTER_PATTERN.search(yaml_data) is not None:
+        return False
+    lines = yaml_data.splitlines()
+    if max(map(len, lines), default=0) > _MAX_LINE_LENGTH:
+        return False
+    # The round-trip parser preserves blank lines, PyYAML drops them.
+    if not all(line.strip() for line in lines):
+        return False
+    return _AMBIGUOUS_SCALAR_PATTERN.search(yaml_data) is None
+
+
+def _contains_null(node: Any) -> bool:
+    """Checks, if the parsed yaml-node contains empty values, which ruamel.yaml dumps without the
+    explicit 'null'.
+
+    Args:
+        node: the parsed yaml-node.
+    Returns:
+        True, if a null value is found.
+    """
+    if isinstance(node, dict):
+        return any(_contains_null(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_contains_null(value) for value in node)
+    return node is None
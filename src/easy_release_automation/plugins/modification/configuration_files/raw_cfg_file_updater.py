@@ -2,13 +2,15 @@
 
 Description:
     Plugin that supports to update configuration files. Thereby, it receives a dictionary as
-    parameter and updates the configuration file with the new configuration entries. Additionally,
-    it preserves comments.
+    parameter and updates the configuration file with the new configuration entries. Solely the
+    lines of the updated parameters are rewritten, new parameters are appended to the top-level
+    parameters. All other lines, including comments, are preserved as they are.
 
     NOTE: This Plugin is designed for a special use-case and has major constraints:
-        - This plugin is written raw configuration files without sections.
-        - Configuration files are not allowed to have comments within configuration
-            lines and comments must be unique.
+        - This plugin is written raw configuration files without sections. Solely the top-level
+            parameters before the first section header are updated.
+        - Configuration parameters are single lines in the format 'key = value' or 'key: value'.
+            Comments within configuration lines are treated as part of the value.
         For a more flexible approach consider using the RegexReplacerPlugin.
 
 Authors:
@@ -19,15 +21,19 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
-import configparser
 import logging
 import pathlib
+import re
+from typing import Any
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import ModificationInterface
 
 logger = logging.getLogger(__name__)
 
+# Start of the first section, e.g., '[metadata]'. The lines afterwards are not updated.
+_SECTION_HEADER_PATTERN = re.compile(r"(?m)^[ \t]*\[")
+
 
 class RAWCfgUpdaterPlugin(ModificationInterface):
     """Plugin that allows to update configuration files."""
@@ -57,6 +63,11 @@ class RAWCfgUpdaterPlugin(ModificationInterface):
             config_path_relative,
             self._release_entry.name,
         )
+        if not configuration:
+            logger.info(
+                "No configuration parameters given for: %s, skipping.", config_path_relative
+            )
+            return
 
         config_path = self._prepare_configuration(config_path_relative)
         self._update_configuration(config_path, configuration, quoted_strings)
@@ -70,15 +81,16 @@ class RAWCfgUpdaterPlugin(ModificationInterface):
             a configuration path that is ensured to exist.
         """
         config_path = self._repository_dir / config_path_relative
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        config_path.touch(exist_ok=True)
+        if not config_path.exists():
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            config_path.touch()
         return config_path
 
     @classmethod
     def _update_configuration(
         cls, config_path: pathlib.Path, configuration: dict[str, str], quoted_strings: bool
     ):
-        """Rewrites the new configuration file for the given path.
+        """Rewrites the lines of the updated parameters in the configuration file.
 
         Args:
             config_path: absolute path to the configuration file.
@@ -87,64 +99,71 @@ class RAWCfgUpdaterPlugin(ModificationInterface):
             quoted_strings: if set True, updated string-values are quoted in the configuration file
                 if set False, updated value strings do not have quotes.
         """
+        logger.info("Reading-in configuration file: %s", config_path)
+        config_text = config_path.read_text()
+        section_match = _SECTION_HEADER_PATTERN.search(config_text)
+        sections_start = len(config_text) if section_match is None else section_match.start()
+        top_level_text, sections_text = config_text[:sections_start], config_text[sections_start:]
 
-        dummy_section = "dummy_section"
+        format_value = cls._format_quoted_value if quoted_strings else str
 
-        config_handler = cls._get_configuration(config_path, dummy_section)
+        new_lines = []
+        is_changed = False
+        for key, raw_value in configuration.items():
+            value = format_value(raw_value)
 
-        for key, value in configuration.items():
-            if quoted_strings and isinstance(value, str):
-                value = f'"{value}"'
-            if key in config_handler[dummy_section]:
-                prev_value = config_handler[dummy_section][key].replace("\n", "")
+            pattern = cls._build_parameter_pattern(key)
+            match = pattern.search(top_level_text)
+            if match is None:
+                logger.info("Introducing new parameter: %s with value: %s.", key, value)
+                new_lines.append(f"{key} = {value}\n")
+            elif match.group("value") == value:
+                logger.debug("Config parameter: %s is already set to: %s.", key, value)
+                continue
+            else:
                 logger.info(
-                    "Updating config parameter: %s from: %s to value: %s.", key, prev_value, value
+                    "Updating config parameter: %s from: %s to value: %s.",
+                    key,
+                    match.group("value"),
+                    value,
                 )
-            else:
-                logger.info("Introducing new parameter: %s with value: %s.", key, value)
-            config_handler[dummy_section][key] = str(value)
+                # A function is used as replacement, as the value must not be parsed as template.
+                top_level_text = pattern.sub(
+                    lambda parameter_match: parameter_match.group("assignment") + value,
+                    top_level_text,
+                    count=1,
+                )
+            is_changed = True
 
-        with config_path.open("w") as config_file:
-            config_handler.write(config_file)
+        if not is_changed:
+            logger.info("Configuration file %s is already up to date.", config_path)
+            return
 
-        cls._cleanup_section(config_path, dummy_section)
+        if new_lines and top_level_text and not top_level_text.endswith("\n"):
+            top_level_text += "\n"
+        config_path.write_text(top_level_text + "".join(new_lines) + sections_text)
 
-    @classmethod
-    def _get_configuration(
-        cls, config_path: pathlib.Path, dummy_section: str
-    ) -> configparser.ConfigParser:
-        """Parses the existing config file including existing comments.
+    @staticmethod
+    def _format_quoted_value(value: Any) -> str:
+        """Formats the configuration value, whereby string-values are quoted.
 
         Args:
-            config_path: absolute path to the configuration file.
-            dummy_section: name of the dummy section.
+            value: the configuration value.
         Returns:
-            a configuration object
+            the formatted value.
         """
-        logger.info("Reading-in configuration file: %s", config_path)
-
-        # NOTE: This approach of reading in files is not recommended, but works for the restricted
-        # use-case of the plugin. The approach preserves unique comments in the configuration file
-        # see: https://stackoverflow.com/a/52306763
-        config = configparser.ConfigParser(allow_no_value=True, strict=False, comment_prefixes="/")
-        config.optionxform = str  # type: ignore [assignment]
-        config.read_string(f"[{dummy_section}]\n" + config_path.read_text())
-        return config
+        return f'"{value}"' if isinstance(value, str) else str(value)
 
     @classmethod
-    def _cleanup_section(cls, config_path: pathlib.Path, dummy_section: str):
-        """Cleans up the dummy-section in the configuration file.
+    def _build_parameter_pattern(cls, key: str) -> re.Pattern:
+        """Builds the pattern matching the configuration lines of the given parameter.
 
         Args:
-            config_path: absolute path to the configuration file.
-            dummy_section: name of the dummy section to delete.
+            key: name of the configuration parameter.
+        Returns:
+            a pattern with the groups 'assignment', i.e., the indentation, key and delimiter, and
+            'value'.
         """
-        logger.debug(
-            "Cleaning up the section: %s from configuration file %s.", dummy_section, config_path
+        return re.compile(
+            rf"(?m)^(?P<assignment>[ \t]*{re.escape(key)}[ \t]*[=:][ \t]*)(?P<value>.*?)[ \t]*$"
         )
-        with config_path.open("r") as config_file:
-            lines = config_file.readlines()
-            lines = [line for line in lines if dummy_section not in line]
-
-        with config_path.open("w") as config_file:
-            config_file.writelines(lines)
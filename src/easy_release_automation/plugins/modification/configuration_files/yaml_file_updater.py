@@ -17,12 +17,11 @@ SPDX-License-Identifier: MIT
 
 import logging
 import pathlib
-from typing import Any
-
-import ruamel.yaml
+from typing import Any, Optional
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import ModificationInterface
+from easy_release_automation.plugins.modification.configuration_files import plain_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +50,9 @@ class YamlUpdaterPlugin(ModificationInterface):
             file_path_relative,
             self._release_entry.name,
         )
+        if not configuration:
+            logger.info("No configuration parameters given for: %s, skipping.", file_path_relative)
+            return
 
         file_path = self._repository_dir / file_path_relative
         self._prepare_yaml(file_path)
@@ -64,8 +66,9 @@ class YamlUpdaterPlugin(ModificationInterface):
         Returns:
             a configuration path that is ensured to exist.
         """
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch(exist_ok=True)
+        if not file_path.exists():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
         return file_path
 
     def _update_yaml(self, config_path: pathlib.Path, configuration: dict[str, str]):
@@ -76,34 +79,35 @@ class YamlUpdaterPlugin(ModificationInterface):
             configuration: dictionary with all configuration parameters as key and configuration
                 values as value. e.g., {"key1/key2/key3": new_val_1, "key1/key3": new_val_2, ...}
         """
-        yaml = ruamel.yaml.YAML()
-        with config_path.open("r") as yaml_file:
-            yaml_string = yaml_file.read()
-        existing_config = yaml.load(yaml_string)
-        existing_config = existing_config if existing_config is not None else {}
 
-        logger.debug("Existing Configuration: \n%s\n", existing_config)
-        for parameter_path, value in configuration.items():
-            self._update_value(parameter_path, value, existing_config)
+        def update(existing_config: dict) -> Optional[dict]:
+            is_changed = False
+            for parameter_path, value in configuration.items():
+                is_changed |= self._update_value(parameter_path, value, existing_config)
+            return existing_config if is_changed else None
 
-        with config_path.open("w") as yaml_file:
-            yaml.dump(existing_config, yaml_file)
+        plain_yaml.update_file(config_path, update)
 
     @classmethod
-    def _update_value(cls, parameter_path: str, value: Any, existing_configuration: dict):
-        """Updates a single Value for the given parameter path
+    def _update_value(cls, parameter_path: str, value: Any, existing_configuration: dict) -> bool:
+        """Updates a single Value for the given parameter path. The value replaces the existing
+        value, i.e., dictionaries are not merged.
 
         Args:
             parameter_path: path to the yaml parameter
             value: the value to which the parameter should be updated
             existing_configuration: dictionary of the existing configuration.
+        Returns:
+            True, if the configuration was changed.
         """
         logger.debug("Updating: %s to value %s", parameter_path, value)
 
         config_branch = existing_configuration
-        path_elements = parameter_path.split("/")
-        for parameter_key in path_elements[:-1]:
-            if parameter_key not in config_branch:
-                config_branch[parameter_key] = {}
-            config_branch = config_branch[parameter_key]
-        config_branch[path_elements[-1]] = value
+        *parent_keys, key = parameter_path.split("/")
+        for parameter_key in parent_keys:
+            config_branch = config_branch.setdefault(parameter_key, {})
+
+        if key in config_branch and config_branch[key] == value:
+            return False
+        config_branch[key] = value
+        return True
@@ -14,12 +14,13 @@ SPDX-License-Identifier: MIT
 
 import logging
 import pathlib
+from typing import Optional
 
-import ruamel.yaml
 from pydantic.v1.utils import deep_update
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import ModificationInterface
+from easy_release_automation.plugins.modification.configuration_files import plain_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ class YamlUpdateV2Plugin(ModificationInterface):
             file_path_relative,
             self._release_entry.name,
         )
+        if not configuration:
+            logger.info("No configuration parameters given for: %s, skipping.", file_path_relative)
+            return
 
         file_path = self._repository_dir / file_path_relative
         self._prepare_yaml(file_path)
@@ -61,8 +65,9 @@ class YamlUpdateV2Plugin(ModificationInterface):
         Returns:
             a configuration path that is ensured to exist.
         """
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.touch(exist_ok=True)
+        if not file_path.exists():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
         return file_path
 
     def _update_yaml(self, config_path: pathlib.Path, configuration: dict):
@@ -72,14 +77,9 @@ class YamlUpdateV2Plugin(ModificationInterface):
             config_path: absolute path to the configuration file.
             configuration: the dictionary, with which the existing dictionary is updated.
         """
-        yaml = ruamel.yaml.YAML()
-        with config_path.open("r") as yaml_file:
-            yaml_string = yaml_file.read()
-        existing_config = yaml.load(yaml_string)
-        existing_config = existing_config if existing_config is not None else {}
 
-        logger.debug("Existing Configuration: \n%s\n", existing_config)
-        existing_config = deep_update(existing_config, configuration)
+        def update(existing_config: dict) -> Optional[dict]:
+            updated_config = deep_update(existing_config, configuration)
+            return None if updated_config == existing_config else updated_config
 
-        with config_path.open("w") as yaml_file:
-            yaml.dump(existing_config, yaml_file)
+        plain_yaml.update_file(config_path, update)
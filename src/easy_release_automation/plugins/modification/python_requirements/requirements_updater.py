@@ -29,11 +29,24 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+from __future__ import annotations
+
+import functools
 import logging
 import pathlib
 import re
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import tomlkit
+    import tomlkit.items
 
-import tomlkit
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    HAS_TOMLLIB = False
+else:
+    HAS_TOMLLIB = True
 
 from easy_release_automation.core.configuration import (
     GlobalConfig,
@@ -44,10 +57,13 @@ from easy_release_automation.interfaces.modification_interface import (
     ModificationException,
     ModificationInterface,
 )
-from easy_release_automation.plugins.modification.regex_replacer import RegexReplacerPlugin
 
 logger = logging.getLogger(__name__)
 
+# Suffixes (.git) and protocol prefixes (git@, https://) of dependency git urls.
+_GIT_SUFFIX_PATTERN = re.compile(r"\.git.*$", re.IGNORECASE)
+_URL_PREFIX_PATTERN = re.compile(r"^(?:git@|https://)", re.IGNORECASE)
+
 
 class RequirementsUpdaterPlugin(ModificationInterface):
     """Plugin that supports an update to requirement files.
@@ -63,7 +79,6 @@ class RequirementsUpdaterPlugin(ModificationInterface):
         self._release_entry = release_entry
         self._global_config = global_config
         self._repository_dir = repository_dir
-        self._regex_replacer = RegexReplacerPlugin(release_entry, global_config, repository_dir)
 
     def run(self, file_paths: list[str] = ["requirements.txt"]) -> None:
         """Updates all requirement files for the given requirements file paths.
@@ -73,14 +88,30 @@ class RequirementsUpdaterPlugin(ModificationInterface):
         """
         logger.info("Update_Requirements: %s, repository: %s", file_paths, self._release_entry.name)
 
+        dependency_references = {}
+        for dependency in self._release_entry.private.dependencies.values():
+            plain_url = self._strip_dependency_url(dependency.url)
+            dependency_references[plain_url.lower()] = self._determine_reference(dependency)
+
+        if not dependency_references:
+            logger.debug("No dependencies to update in: %s.", file_paths)
+            return
+
+        # The pattern is built once for all files, and updates all dependencies within a single
+        # pass through each file.
+        pattern, replacement = self._build_dependency_replacer(dependency_references)
         for file_path in file_paths:
-            self._update_file(file_path)
+            self._update_file(file_path, pattern, replacement)
 
-    def _update_file(self, file_path: str) -> None:
+    def _update_file(
+        self, file_path: str, pattern: re.Pattern, replacement: Callable[[re.Match], str]
+    ) -> None:
         """Updates a file with the new dependencies.
 
         Args:
             file_path: path to the requirement file.
+            pattern: a compiled regex to match the dependencies
+            replacement: the corresponding replacement function with the new references
         """
         full_path = self._repository_dir / file_path
 
@@ -92,19 +123,15 @@ class RequirementsUpdaterPlugin(ModificationInterface):
                 file_path,
             )
 
-            reference = self._determine_reference(dependency)
-            plain_url = self._strip_dependency_url(dependency.url)
-            pattern, replacement = self._build_dependency_replacer_strings(plain_url, reference)
-
-            if full_path.suffix == ".toml":
-                # pyproject.toml
-                self._update_pyproject_toml_file(full_path, pattern, replacement)
-            else:
-                # requirements.txt, requirements.in
-                self._update_requirement_file(pathlib.Path(file_path), pattern, replacement)
+        if full_path.suffix == ".toml":
+            # pyproject.toml
+            new_content = self._update_pyproject_toml_file(full_path, pattern, replacement)
+        else:
+            # requirements.txt, requirements.in
+            new_content = self._update_requirement_file(full_path, pattern, replacement)
 
-        with open(full_path, "r", encoding="utf-8") as file:
-            logger.debug("Updated Requirement-File %s to: \n%s", full_path, file.read())
+        if new_content is not None:
+            logger.debug("Updated Requirement-File %s to: \n%s", full_path, new_content)
 
     def _determine_reference(self, dependency: PublicReleaseEntry) -> str:
         """Determines to reference to update to. Uses 'main' if no version is specified or ERA is
@@ -132,9 +159,11 @@ class RequirementsUpdaterPlugin(ModificationInterface):
 
         return reference
 
-    @classmethod
-    def _strip_dependency_url(cls, url: str) -> str:
-        """Removes url-prefixes (git@, https://) and suffixes (.git) from dependency git urls.
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _strip_dependency_url(url: str) -> str:
+        """Removes url-prefixes (git@, https://) and suffixes (.git) from dependency git urls. The
+        result is cached, as the same dependencies are updated in several files and repositories.
 
         Args:
             url: dependency (git-)url
@@ -142,56 +171,105 @@ class RequirementsUpdaterPlugin(ModificationInterface):
         Returns:
             str: the stripped url
         """
-        url_plain = re.sub(r"\.git.*$", "", url, flags=re.IGNORECASE)
-        url_plain = re.sub(r"^(?:git@|https://)", "", url_plain, flags=re.IGNORECASE)
-        return url_plain
+        return _URL_PREFIX_PATTERN.sub("", _GIT_SUFFIX_PATTERN.sub("", url))
 
     @classmethod
-    def _build_dependency_replacer_strings(cls, url: str, reference: str) -> tuple[str, str]:
-        """Builds regexes for matching/replacing the reference in requirements-files.
+    def _build_dependency_replacer(
+        cls, dependency_references: dict[str, str]
+    ) -> tuple[re.Pattern, Callable[[re.Match], str]]:
+        """Builds a single regex for matching the references of all dependencies in
+        requirements-files, and the corresponding replacement function.
 
         Args:
-            url (str): the stripped dependency url
-            reference (str): the new dependency reference
+            dependency_references: the new dependency references by the lower-case stripped
+                                   dependency urls.
 
         Returns:
-            tuple[str, str]: regex (pattern, replacement) to be used with re.sub(...) to update the
-                             reference.
+            tuple[re.Pattern, Callable[[re.Match], str]]: the compiled pattern and the replacement
+                to be used with pattern.sub(...) to update the references.
         """
-        pattern = rf"(?mi)(.*{url}(?:\.git){{0,1}})(@.*){{0,1}}$"
-        replacement = rf"\1@{reference}"
+        urls = "|".join(re.escape(url) for url in dependency_references)
+        # The match is anchored at the line start, as the dependency prefix may contain whitespace
+        # (e.g. "name @ git+url"). The reference suffix is bounded by whitespace, comments or
+        # environment markers, which are kept, so that it cannot run into the remainder of a line.
+        pattern = re.compile(rf"""(?mix)
+            ^(.*(?P<url>{urls})(?:\.git)?)  # dependency up to the url
+            (?:@[^\s\#;]*)?                  # optional reference
+            (?=[\s\#;]|$)                    # end of the dependency url
+            """)
+
+        def replacement(dependency_match: re.Match) -> str:
+            reference = dependency_references[dependency_match.group("url").lower()]
+            return f"{dependency_match.group(1)}@{reference}"
+
         return (pattern, replacement)
 
+    @classmethod
     def _update_requirement_file(
-        self, requirements_path: pathlib.Path, pattern: str, replacement: str
-    ) -> None:
+        cls,
+        requirements_path: pathlib.Path,
+        pattern: re.Pattern,
+        replacement: Callable[[re.Match], str],
+    ) -> Optional[str]:
         """Rewrites the requirements file with the updated dependencies.
 
         Args:
-            requirements_path: relative path to the requirements file that should be updated.
-            pattern: a regex to match the dependency
-            replacement: the corresponding replacement string
+            requirements_path: path to the requirements file that should be updated.
+            pattern: a compiled regex to match the dependencies
+            replacement: the corresponding replacement function
+
+        Raises:
+            ReleaseModificationException: raised, if the file is not found.
+
+        Returns:
+            Optional[str]: the new file content, or None, if no dependency is found.
         """
         try:
-            self._regex_replacer.run(requirements_path, pattern, replacement, replacement_count=0)
-        except ModificationException:
+            with requirements_path.open("r", newline="") as requirements_file:
+                content = requirements_file.read()
+        except FileNotFoundError as err:
+            raise ModificationException(f"File {requirements_path} not found.") from err
+
+        new_content, replacement_count = pattern.subn(replacement, content)
+        if replacement_count == 0:
             logger.debug("No matching dependency found in: %s.", requirements_path)
+            return None
+
+        with requirements_path.open("w", newline="") as requirements_file:
+            requirements_file.write(new_content)
+        return new_content
 
     @classmethod
     def _update_pyproject_toml_file(
-        cls, pyproject_path: pathlib.Path, pattern: str, replacement: str
-    ) -> None:
+        cls,
+        pyproject_path: pathlib.Path,
+        pattern: re.Pattern,
+        replacement: Callable[[re.Match], str],
+    ) -> Optional[str]:
         """Rewrites the pyproject.toml file with updated dependencies.
 
         Args:
             pyproject_path: path to the requirements file that should be updated.
-            pattern: a regex to match the dependency
-            replacement: the corresponding replacement string with the new reference
+            pattern: a compiled regex to match the dependencies
+            replacement: the corresponding replacement function with the new references
+
+        Returns:
+            Optional[str]: the new file content, or None, if all dependencies are up to date.
         """
+        # The style-preserving round-trip of tomlkit is slow, so that it is skipped for files
+        # without outdated dependencies.
+        toml_project = cls.load_pyproject_toml(pyproject_path).get("project")
+        if isinstance(toml_project, dict) and all(
+            pattern.sub(replacement, dependency, count=1) == dependency
+            for dependency in cls._iter_toml_dependencies(toml_project)
+        ):
+            logger.debug("No outdated dependency found in: %s.", pyproject_path)
+            return None
+
         toml = cls.read_pyproject_toml(pyproject_path)
 
         cls._update_toml_dependencies(toml, pattern, replacement)
-        cls._rewrite_toml_file(pyproject_path, toml)
+        return cls._rewrite_toml_file(pyproject_path, toml)
 
     @staticmethod
     def read_pyproject_toml(file_path: pathlib.Path) -> tomlkit.TOMLDocument:
@@ -207,6 +285,8 @@ class RequirementsUpdaterPlugin(ModificationInterface):
         Returns:
             tomlkit.TOMLDocument: the parsed toml.
         """
+        import tomlkit
+
         try:
             with open(file_path, mode="rb") as f:
                 content = f.read()
@@ -218,17 +298,62 @@ class RequirementsUpdaterPlugin(ModificationInterface):
 
         return toml
 
+    @classmethod
+    def load_pyproject_toml(cls, file_path: pathlib.Path) -> dict:
+        """Parses the pyproject.toml file into plain python objects, e.g., to look up the
+        dependencies without modifying the file. The parser of the standard library is used, if
+        available, as it is significantly faster than the style-preserving parser of tomlkit.
+
+        Args:
+            file_path (pathlib.Path): the path to the pyproject.toml file.
+
+        Raises:
+            ReleaseModificationException: raised, if file not found or toml cannot be parsed.
+
+        Returns:
+            dict: the parsed toml.
+        """
+        if not HAS_TOMLLIB:
+            return cls.read_pyproject_toml(file_path).unwrap()
+
+        try:
+            with open(file_path, mode="rb") as f:
+                return tomllib.load(f)
+        except FileNotFoundError as err:
+            raise ModificationException(f"File {file_path} not found.") from err
+        except tomllib.TOMLDecodeError as err:
+            raise ModificationException(f"File {file_path} is not valid TOML: {err}") from err
+
+    @staticmethod
+    def _iter_toml_dependencies(toml_project: dict) -> Iterator[str]:
+        """Iterates over the main and optional dependencies of the parsed project section.
+
+        Args:
+            toml_project: the parsed 'project' section of a pyproject.toml file.
+
+        Returns:
+            Iterator[str]: the dependency entries.
+        """
+        yield from toml_project.get("dependencies", [])
+        for entries in toml_project.get("optional-dependencies", {}).values():
+            yield from entries
+
     @classmethod
     def _update_toml_dependencies(
-        cls, toml: tomlkit.TOMLDocument, pattern: str, replacement: str
+        cls,
+        toml: tomlkit.TOMLDocument,
+        pattern: re.Pattern,
+        replacement: Callable[[re.Match], str],
     ) -> None:
         """Updates dependencies in a pyproject.toml file.
 
         Args:
             toml: the parsed pyproject.toml file.
-            pattern: a regex to match the dependency
-            replacement: the corresponding replacement string with the new reference
+            pattern: a compiled regex to match the dependencies
+            replacement: the corresponding replacement function with the new references
         """
+        import tomlkit
+
         try:
             toml_project = toml["project"]
             assert isinstance(toml_project, tomlkit.items.Table)
@@ -246,27 +371,40 @@ class RequirementsUpdaterPlugin(ModificationInterface):
             )
 
     @classmethod
-    def _rewrite_toml_file(cls, pyproject_path: pathlib.Path, toml: tomlkit.TOMLDocument) -> None:
+    def _rewrite_toml_file(cls, pyproject_path: pathlib.Path, toml: tomlkit.TOMLDocument) -> str:
         """Overwrites the pyproject.toml file.
 
         Args:
             pyproject_path: path to the pyproject.toml file.
             toml: Toml object to be written to file.
+
+        Returns:
+            str: the written file content.
         """
+        import tomlkit
+
+        content = tomlkit.dumps(toml)
         with open(pyproject_path, mode="w", encoding="utf-8") as toml_file:
-            tomlkit.dump(toml, toml_file)
+            toml_file.write(content)
+        return content
 
     @classmethod
     def _update_toml_dependency(
-        cls, toml_section: tomlkit.items.Array, pattern: str, replacement: str
+        cls,
+        toml_section: tomlkit.items.Array,
+        pattern: re.Pattern,
+        replacement: Callable[[re.Match], str],
     ) -> None:
         """Updates the dependencies in the specified toml_section.
 
         Args:
             toml_section: The toml section containing the dependencies, e.g. project.dependencies or
                           project.optional-dependencies.test.
-            pattern: a regex to match the dependency
-            replacement: the corresponding replacement string with the new reference
+            pattern: a compiled regex to match the dependencies
+            replacement: the corresponding replacement function with the new references
         """
         for idx, item in enumerate(toml_section):
-            toml_section[idx] = re.sub(pattern, replacement, item, count=1)
+            updated_item = pattern.sub(replacement, item, count=1)
+            # Assigning items is costly in tomlkit, as the array is re-styled on each assignment.
+            if updated_item != item:
+                toml_section[idx] = updated_item
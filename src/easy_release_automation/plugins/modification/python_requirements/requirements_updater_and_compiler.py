@@ -21,8 +21,10 @@ SPDX-License-Identifier: MIT
 """
 
 import logging
+import os
 import pathlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import (
@@ -49,11 +51,16 @@ class RequirementsUpdaterAndCompilerPlugin(ModificationInterface):
             release_entry, global_config, repository_dir
         )
 
-    def run(self, file_paths: list[str] = ["requirements.in"]):
+    def run(self, file_paths: list[str] = ["requirements.in"], parallel_compilation: bool = False):
         """The run method updates and compiles the requirement files.
 
         Args:
             file_paths: List of file paths to the requirement files that should be updated.
+            parallel_compilation: if set to True, the main and optional dependencies of a
+                pyproject.toml are compiled concurrently. NOTE: all compilations build the project
+                metadata in the same directory, e.g., '*.egg-info' or 'build/' with setuptools, and
+                share the pip-tools cache. Solely enable it for build backends, that tolerate
+                concurrent builds.
         """
         logger.info(
             "Update&Compile Requirements: %s, repository: %s", file_paths, self._release_entry.name
@@ -69,7 +76,7 @@ class RequirementsUpdaterAndCompilerPlugin(ModificationInterface):
                     raise ModificationException(
                         "Compilation not possible. File name must be 'pyproject.toml'"
                     )
-                self._compile_pyproject_toml(full_path)
+                self._compile_pyproject_toml(full_path, parallel_compilation)
             else:
                 self._compile_requirements(full_path)
 
@@ -82,21 +89,23 @@ class RequirementsUpdaterAndCompilerPlugin(ModificationInterface):
         """
 
         logger.debug("Compiling %s", file_path)
-        command = f"pip-compile {file_path.name}"
+        command = ["pip-compile", file_path.name]
         cls._execute_compilation(command, file_path.parent)
 
-    def _compile_pyproject_toml(self, file_path: pathlib.Path):
+    def _compile_pyproject_toml(self, file_path: pathlib.Path, parallel: bool = False):
         """Compiles the dependencies from a pyproject.toml.
 
         The output files are requirements.txt, requirements-<extra>.txt.
 
         Args:
             file_path: path to the un-compiled requirements file.
+            parallel: if set to True, the compilations are executed concurrently. Otherwise, they
+                are executed sequentially.
         """
         logger.debug("Compiling %s", file_path)
 
         # NOTE: this is not ideal, perhaps move that function to util/ ?
-        toml = self._requirement_updater.read_pyproject_toml(file_path)
+        toml = self._requirement_updater.load_pyproject_toml(file_path)
 
         try:
             toml_project = toml["project"]
@@ -105,32 +114,56 @@ class RequirementsUpdaterAndCompilerPlugin(ModificationInterface):
                 f"{file_path} is not a valid pyproject.toml, no 'project' section found"
             ) from err
 
+        commands: list[list[str]] = []
         if toml_project.get("dependencies", None):
-            command = f"pip-compile -o requirements.txt {file_path.name}"
-            self._execute_compilation(command, file_path.parent)
+            commands.append(["pip-compile", "-o", "requirements.txt", file_path.name])
 
         for extra_dep_section in toml_project.get("optional-dependencies", []):
-            command = (
-                f"pip-compile "
-                f"--extra={extra_dep_section} "
-                f"-o requirements-{extra_dep_section}.txt "
-                f"{file_path.name}"
+            commands.append(
+                [
+                    "pip-compile",
+                    f"--extra={extra_dep_section}",
+                    "-o",
+                    f"requirements-{extra_dep_section}.txt",
+                    file_path.name,
+                ]
             )
-            self._execute_compilation(command, file_path.parent)
+
+        if not parallel or len(commands) <= 1:
+            for command in commands:
+                self._execute_compilation(command, file_path.parent)
+            return
+
+        # Each compilation writes its own output file, but builds the project metadata in the same
+        # directory. Therefore, the concurrent compilation is opt-in.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(commands), os.cpu_count() or 1))
+        ) as pool:
+            futures = [
+                pool.submit(self._execute_compilation, command, file_path.parent)
+                for command in commands
+            ]
+        for future in futures:
+            future.result()  # Re-raises exceptions of the compilation
 
     @classmethod
-    def _execute_compilation(cls, command: str, cwd: pathlib.Path):
-        """Runs the specified command as subprocess.
+    def _execute_compilation(cls, command: list[str], cwd: pathlib.Path):
+        """Runs the specified command as subprocess. The command is executed directly, i.e.,
+        without spawning a shell and without any shell quoting of the arguments.
 
         Args:
-            command: the shell command, e.g. 'pip-compile requirements.in'
+            command: the command arguments, e.g. ['pip-compile', 'requirements.in']
             cwd: the working directory to run this command from.
 
         Raises:
             ReleaseModificationException: raised, if the command execution fails.
         """
         try:
-            process = subprocess.run(command, capture_output=True, shell=True, check=True, cwd=cwd)
+            process = subprocess.run(command, capture_output=True, check=True, cwd=cwd)
+        except FileNotFoundError as error:
+            raise ModificationException(
+                f"Executing command {command} failed: {command[0]} not found."
+            ) from error
         except subprocess.CalledProcessError as error:
             raise ModificationException(
                 f"Executing git command {command} failed with: "
@@ -14,10 +14,14 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+import functools
 import logging
+import os
 import pathlib
 import re
-from typing import Union
+import shutil
+import tempfile
+from typing import AnyStr, Optional, Union
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import (
@@ -27,6 +31,8 @@ from easy_release_automation.interfaces.modification_interface import (
 
 logger = logging.getLogger(__name__)
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
 
 class RegexReplacerPlugin(ModificationInterface):
     """Plugin that allows to update configuration files."""
@@ -41,7 +47,7 @@ class RegexReplacerPlugin(ModificationInterface):
     def run(
         self,
         file_path_relative: str,
-        regex: str,
+        regex: Union[str, re.Pattern],
         replacement: Union[str, list[str]] = "",
         replacement_count: int = 0,
     ):
@@ -53,7 +59,8 @@ class RegexReplacerPlugin(ModificationInterface):
 
         Args:
             file_path_relative: path to the configuration file (relative to the repository).
-            regex: a regex string to match all text snippets, that need to be replaced.
+            regex: a regex string, or an already compiled pattern, to match all text snippets, that
+                   need to be replaced.
             replacement: string, or a list of strings, that will be joined to build a replacement
                          string.
             replacement_count: the number of occurrences to replace. If set to 0,
@@ -81,11 +88,12 @@ class RegexReplacerPlugin(ModificationInterface):
         return "".join(replacement) if isinstance(replacement, list) else replacement
 
     @classmethod
-    def compile_regex(cls, regex: str) -> re.Pattern:
-        """Compiles the regex and throws an appropriate exception, when it fails.
+    def compile_regex(cls, regex: Union[str, re.Pattern]) -> re.Pattern:
+        """Compiles the regex and throws an appropriate exception, when it fails. Already compiled
+        patterns are returned as they are.
 
         Args:
-            regex (str): The regex definition as string.
+            regex (str | re.Pattern): The regex definition as string or compiled pattern.
 
         Raises:
             ReleaseModificationException: Thrown, if the regex is not valid.
@@ -93,6 +101,9 @@ class RegexReplacerPlugin(ModificationInterface):
         Returns:
             re.Pattern: The compiled regex pattern.
         """
+        if isinstance(regex, re.Pattern):
+            return regex
+
         try:
             pattern = re.compile(regex)
         except re.error as regex_error:
@@ -111,7 +122,8 @@ class RegexReplacerPlugin(ModificationInterface):
         replacement_str: str,
         replacement_count: int,
     ):
-        """Rewrites the file at the given path.
+        """Rewrites the file at the given path. Patterns compiled from bytes are applied on the
+        raw file content, so that the content is neither decoded nor encoded again.
 
         Raises:
             ReleaseModificationException: Thrown, if the search pattern is not found.
@@ -123,21 +135,82 @@ class RegexReplacerPlugin(ModificationInterface):
             replacement_count: the number of occurrences to replace. If set to 0,
                                all occurrences will be replaced.
         """
+        is_binary = isinstance(pattern.pattern, bytes)
         try:
-            with file_path.open("r", newline="") as in_file:
-                content = in_file.read()
+            if is_binary:
+                content = file_path.read_bytes()
+            else:
+                with file_path.open("r", newline="") as in_file:
+                    content = in_file.read()
         except FileNotFoundError as file_not_found_error:
             raise ModificationException(f"{file_path} not found.") from file_not_found_error
 
         logger.debug("existing file contents: \n%s", content)
 
-        match = re.search(pattern, content)
-        if match is None:
-            raise ModificationException(f"{file_path} does not contain a match for {pattern}.")
-
-        new_content = re.sub(pattern, replacement_str, content, count=replacement_count)
+        replacement = replacement_str.encode() if is_binary else replacement_str
+        literal = _get_literal(pattern)
+        if literal is not None and "\\" not in replacement_str:
+            # Literal patterns without replacement templates are replaced without the regex engine.
+            if literal not in content:
+                raise ModificationException(f"{file_path} does not contain a match for {pattern}.")
+            new_content = content.replace(literal, replacement, replacement_count or -1)
+        else:
+            # The number of substitutions is returned along, so that the content is scanned once.
+            new_content, substitution_count = pattern.subn(
+                replacement, content, count=replacement_count
+            )
+            if substitution_count == 0:
+                raise ModificationException(f"{file_path} does not contain a match for {pattern}.")
 
         logger.debug("new file contents: \n%s", new_content)
 
-        with file_path.open("w", newline="") as out_file:
-            out_file.write(new_content)
+        _write_atomically(file_path, new_content)
+
+
+def _write_atomically(file_path: pathlib.Path, content: AnyStr) -> None:
+    """Writes the content into a temporary file next to the file, which then replaces the file.
+    Thus, the file is either updated completely or left untouched, if writing fails. The file
+    permissions are kept. Symbolic links are resolved, so that the link target is replaced instead
+    of the link.
+
+    Args:
+        file_path: absolute path to the file.
+        content: the new file content. Text is written without newline translation.
+    """
+    file_path = file_path.resolve()
+    # The unique hidden name does not collide with existing files of the repository.
+    file_descriptor, temporary_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}."
+    )
+    temporary_path = pathlib.Path(temporary_name)
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(file_descriptor, "wb") as out_file:
+                out_file.write(content)
+        else:
+            with os.fdopen(file_descriptor, "w", newline="") as out_file:
+                out_file.write(content)
+        shutil.copymode(file_path, temporary_path)
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=128)
+def _get_literal(pattern: "re.Pattern[AnyStr]") -> Optional[AnyStr]:
+    """Determines, if the pattern solely matches a literal text, i.e., it contains neither regex
+    meta-characters nor flags, that change the matching of literal text.
+
+    Args:
+        pattern: the compiled regex pattern.
+    Returns:
+        the literal text, or None, if the pattern is not a literal.
+    """
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    regex = pattern.pattern
+    characters = regex.decode("latin-1") if isinstance(regex, bytes) else regex
+    if not characters or _REGEX_METACHARACTERS.intersection(characters):
+        return None
+    return regex
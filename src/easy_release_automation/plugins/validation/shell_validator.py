@@ -58,12 +58,21 @@ class ShellValidationPlugin(ValidationInterface):
         """
         logger.info("Executing Shell Command: %s from directory: %s", command, self._repository_dir)
 
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, cwd=self._repository_dir)
-        logger.info("Output:")
-        while process.poll() is None:
-            line = process.stdout.readline()  # type: ignore [union-attr]
-            if line:
-                logger.info(line.decode("utf-8"))
+        # Iterating the line-buffered text stream consumes the output until the end of the
+        # process, including the trailing lines. Error messages are merged into the output, which
+        # is decoded as utf-8 independent of the locale, and undecodable bytes are replaced.
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            encoding="utf-8",
+            errors="replace",
+            cwd=self._repository_dir,
+        ) as process:
+            logger.info("Output:")
+            for line in process.stdout:  # type: ignore [union-attr]
+                logger.info(line.rstrip())
 
         if process.returncode != 0:
             raise ValidationException(
@@ -11,8 +11,9 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+import functools
 import logging
-from dataclasses import asdict
+from dataclasses import fields
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 
@@ -23,79 +24,92 @@ CHAPTER_DELIMITER = "\n" + ("*" * 80) + "\n"
 SUB_CHAPTER_DELIMITER = CHAPTER_DELIMITER
 PLUGIN_DELIMITER = "\n" + ("_" * 80)
 
+# Constant parts of the formatted checkpoints.
+_MAJOR_PREFIX = f"\n{MAJOR_LOG_DELIMITER}\n"
+_CHAPTER_PREFIX = f"\n{CHAPTER_DELIMITER}**** Chapter: "
+_SUB_CHAPTER_PREFIX = f"\n{SUB_CHAPTER_DELIMITER}**** Sub-Chapter: "
 
-class CustomLogRecord(logging.LogRecord):
-    """Reduces the origin string to file-name, function-name and linenumber."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.origin = f"[{self.filename}.{self.funcName}:{self.lineno}]"
+class OriginFormatter(logging.Formatter):
+    """Reduces the origin string to file-name, function-name and linenumber. The origin is
+    solely formatted for records, that are emitted by the handler."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.origin = f"[{record.filename}.{record.funcName}:{record.lineno}]"
+        return super().format(record)
 
 
 def configure_logging(level: str = "INFO"):
     """Setting up the logging-level and format."""
 
-    logging.setLogRecordFactory(CustomLogRecord)
     log_format = "%(levelname)-7s %(origin)-50s %(message)s"
-    logging.basicConfig(
-        level=level,
-        format=log_format,
-        datefmt="%d/%b/%Y %H:%M:%S",
-    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(OriginFormatter(log_format, datefmt="%d/%b/%Y %H:%M:%S"))
+    logging.basicConfig(level=level, handlers=[handler])
 
 
 def format_major(message: str):
     """Formats major checkpoints, such as starting or finishing the program."""
-    return "".join(["\n", MAJOR_LOG_DELIMITER, "\n", message, "\n", MAJOR_LOG_DELIMITER])
+    return f"{_MAJOR_PREFIX}{message}\n{MAJOR_LOG_DELIMITER}"
 
 
+# NOTE: The checkpoints are formatted from constant templates, which contain the %-style placeholders
+# of the log arguments. Thus, the formatted templates are cached.
+@functools.lru_cache(maxsize=128)
 def format_minor(message: str):
     """Formats a minor checkpoint during the execution."""
-    return "".join(["\n\n---- ", message, PLUGIN_DELIMITER])
+    return f"\n\n---- {message}{PLUGIN_DELIMITER}"
 
 
+@functools.lru_cache(maxsize=128)
 def format_chapter(chapter: str):
     """Formats release chapters during the execution."""
-    return "".join(["\n", CHAPTER_DELIMITER, "**** Chapter: ", chapter, CHAPTER_DELIMITER])
+    return f"{_CHAPTER_PREFIX}{chapter}{CHAPTER_DELIMITER}"
 
 
+@functools.lru_cache(maxsize=128)
 def format_sub_chapter(sub_chapter: str):
     """Formats release sub-chapters during the execution."""
-    return "".join(
-        ["\n", SUB_CHAPTER_DELIMITER, "**** Sub-Chapter: ", sub_chapter, SUB_CHAPTER_DELIMITER]
-    )
+    return f"{_SUB_CHAPTER_PREFIX}{sub_chapter}{SUB_CHAPTER_DELIMITER}"
 
 
 def log_release_information(release_entries: list[ReleaseEntry], global_config: GlobalConfig):
-    """Logs release information for the upcoming release."""
-    releasing = ""
-    skipping = ""
+    """Logs release information for the upcoming release. The information is solely assembled, if
+    it is logged."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    releasing: list[str] = []
+    skipping: list[str] = []
     release_type = (
         "Executing Test Release" if global_config.test_run else "Executing Production Release"
     )
 
     for release_entry in release_entries:
-        repo_string = ""
-        repo_string += "\t - "
-        repo_string += f"Repository: '{release_entry.public.name}'"
-        repo_string += f", using version: '{release_entry.public.version}'"
-        repo_string += f", main-branch: '{release_entry.public.main_branch}'"
-        repo_string += f", stable-branch: '{release_entry.public.stable_branch}'."
-        repo_string += "\n"
+        repo_string = (
+            f"\t - Repository: '{release_entry.public.name}'"
+            f", using version: '{release_entry.public.version}'"
+            f", main-branch: '{release_entry.public.main_branch}'"
+            f", stable-branch: '{release_entry.public.stable_branch}'.\n"
+        )
 
         if release_entry.private.should_skip:
-            skipping += repo_string
+            skipping.append(repo_string)
         else:
-            releasing += repo_string
+            releasing.append(repo_string)
+    # The fields are read directly, as asdict(...) would deep-copy all values.
     global_config_str = "\n".join(
-        [f"\t - {key}: '{value}'" for key, value in asdict(global_config).items()]
+        [
+            f"\t - {field.name}: '{getattr(global_config, field.name)}'"
+            for field in fields(global_config)
+        ]
     )
 
     logger.info(
         format_major(
             f"\033[1m{release_type}\033[0m"
-            f"\n\nReleasing:\n{releasing}"
-            f"\n\nSkipping:\n{skipping}"
+            f"\n\nReleasing:\n{''.join(releasing)}"
+            f"\n\nSkipping:\n{''.join(skipping)}"
             f"\n\nGlobal Configuration:\n{global_config_str}"
         )
     )
@@ -12,6 +12,7 @@ import pytest
 import pathlib
 from easy_release_automation.core.configuration import PluginEntries
 from easy_release_automation.core.plugin_executor import PluginExecutor, PluginExecutorError
+from easy_release_automation.plugins.validation import shell_validator
 from ..fixtures.default_config import default_release_entry, default_global_config
 
 
@@ -22,13 +23,48 @@ def test_plugin_executor_non_existing_plugin(
     plugin_executor = PluginExecutor(default_release_entry, default_global_config, tmp_path)
     default_release_entry.plugins = PluginEntries(
         release_modification=[],
-        release_validation=[{"non-existing-plugin": []}],
+        release_validation=[
+            {"non-existing-plugin": []},
+            {"validate_via_shell": {"command": ["ls"]}},
+            {"other-non-existing-plugin": None},
+        ],
+        merge_back_finalization=[],
+    )
+    with pytest.raises(PluginExecutorError) as exc_info:
+        plugin_executor.validate_release_branch()
+    # All unknown plugins are reported at once.
+    assert "'non-existing-plugin'" in exc_info.value.args[0]
+    assert "'other-non-existing-plugin'" in exc_info.value.args[0]
+
+
+def test_plugin_executor_ambiguous_plugin_entry(
+    tmp_path: pathlib.Path, default_release_entry, default_global_config
+):
+    """Validates, that PluginExecutorError is risen on plugin entries with several plugins."""
+    plugin_executor = PluginExecutor(default_release_entry, default_global_config, tmp_path)
+    default_release_entry.plugins = PluginEntries(
+        release_modification=[],
+        release_validation=[{"validate_via_shell": {"command": ["ls"]}, "other-plugin": None}],
         merge_back_finalization=[],
     )
     with pytest.raises(PluginExecutorError):
         plugin_executor.validate_release_branch()
 
 
+def test_plugin_executor_prepare_validates_all_stages(
+    tmp_path: pathlib.Path, default_release_entry, default_global_config
+):
+    """Validates, that the plugins of all stages are validated, before the first stage is executed."""
+    plugin_executor = PluginExecutor(default_release_entry, default_global_config, tmp_path)
+    default_release_entry.plugins = PluginEntries(
+        release_modification=[],
+        release_validation=[{"validate_via_shell": {"command": ["ls"]}}],
+        merge_back_finalization=[{"non-existing-plugin": None}],
+    )
+    with pytest.raises(PluginExecutorError, match="non-existing-plugin"):
+        plugin_executor.modify_release_branch()
+
+
 def test_plugin_executor_existing_plugin(
     mocker, tmp_path: pathlib.Path, default_release_entry, default_global_config
 ):
@@ -51,9 +87,9 @@ def test_plugin_executor_existing_plugin(
         "easy_release_automation.plugins.validation.shell_validator.subprocess"
     )
     popen_instance = mocker.MagicMock()
-    subprocess_mock.Popen.return_value = popen_instance
-    # Avoid polling
-    popen_instance.poll.return_value = 0
+    subprocess_mock.Popen.return_value.__enter__.return_value = popen_instance
+    # Avoid output
+    popen_instance.stdout = iter([])
     # Imitate a successful call
     popen_instance.returncode = 0
 
@@ -63,3 +99,38 @@ def test_plugin_executor_existing_plugin(
     # Validate a correct call
     assert subprocess_mock.Popen.call_count == 1
     assert subprocess_mock.Popen.call_args[0] == (command,)
+
+
+def test_plugin_executor_parallel_validation(
+    mocker, tmp_path: pathlib.Path, default_release_entry, default_global_config
+):
+    """Validates, that all validation plugins are executed, if they are executed concurrently, and
+    that failing plugins are reported."""
+    plugin_executor = PluginExecutor(default_release_entry, default_global_config, tmp_path)
+    default_release_entry.plugins = PluginEntries(
+        release_modification=[],
+        release_validation=[
+            {"validate_via_shell": {"command": ["ls"]}},
+            {"validate_via_shell": {"command": ["pwd"]}},
+        ],
+        merge_back_finalization=[],
+        parallel_validation=True,
+    )
+    subprocess_mock = mocker.patch(
+        "easy_release_automation.plugins.validation.shell_validator.subprocess"
+    )
+    popen_instance = mocker.MagicMock()
+    subprocess_mock.Popen.return_value.__enter__.return_value = popen_instance
+    popen_instance.stdout = []
+    popen_instance.returncode = 0
+
+    plugin_executor.validate_release_branch()
+
+    assert sorted(call[0] for call in subprocess_mock.Popen.call_args_list) == [
+        (["ls"],),
+        (["pwd"],),
+    ]
+
+    popen_instance.returncode = 1
+    with pytest.raises(shell_validator.ValidationException):
+        plugin_executor.validate_release_branch()
@@ -0,0 +1,106 @@
+"""Tests for the configuration dataclasses
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import datetime
+
+import pytest
+
+from easy_release_automation.core import configuration
+
+
+def test_from_dict__ignores_unknown_keys_and_sets_defaults():
+    """Tests, if additional keys are ignored and missing optional keys are set to their defaults."""
+    public_entry = configuration.PublicReleaseEntry.from_dict(
+        {"name": "package_1", "url": "_", "version": "1.0.0", "plugins": {}}
+    )
+    private_entry = configuration.PrivateReleaseEntry.from_dict({"url": "_"})
+
+    assert public_entry == configuration.PublicReleaseEntry("package_1", "_", "1.0.0")
+    assert private_entry == configuration.PrivateReleaseEntry()
+    # Default factories must not share their instances.
+    assert private_entry.dependencies is not configuration.PrivateReleaseEntry().dependencies
+
+
+def test_from_dict__missing_required_key():
+    """Tests, if a TypeError is raised, if a required key is missing."""
+    with pytest.raises(TypeError) as exc_info:
+        configuration.PublicReleaseEntry.from_dict({"name": "package_1"})
+    assert "url" in exc_info.value.args[0]
+
+
+@pytest.mark.parametrize(
+    "repository, invalid_path",
+    [
+        ({"version": "1.0.0"}, "repositories/package_1/url"),
+        ({"url": "_", "dependencies": "package_2"}, "repositories/package_1/dependencies"),
+        ({"url": "_", "plugins": {"release_validation": {}}}, "plugins/release_validation"),
+        ({"url": "_", "plugins": {"release_validation": ["plugin"]}}, "plugins/release_validation"),
+        ({"url": "_", "plugins": {"parallel_validation": "yes"}}, "plugins/parallel_validation"),
+    ],
+)
+def test_validate_configuration__invalid_repository(repository: dict, invalid_path: str):
+    """Tests, if an invalid release-entry is reported with the path of the invalid parameter."""
+    config = {
+        "global_config": {"git_user_name": "a", "git_user_email": "b"},
+        "repositories": {"package_1": repository},
+    }
+    with pytest.raises(configuration.ConfigurationHandlerException) as exc_info:
+        configuration.validate_configuration(config)
+    assert invalid_path in exc_info.value.args[0]
+
+
+@pytest.mark.parametrize("release_date", ["2024-01-31", datetime.date(2024, 1, 31)])
+def test_validate_configuration__valid_release_date(release_date):
+    """Tests, if the release-date may be given as ISO string or as date parsed by yaml."""
+    config = {
+        "global_config": {
+            "git_user_name": "a",
+            "git_user_email": "b",
+            "release_date": release_date,
+        },
+        "repositories": {},
+    }
+    configuration.validate_configuration(config)
+
+
+@pytest.mark.parametrize(
+    "release_date",
+    [
+        "31.01.2024",
+        "2024-02-30",
+        "20240131",
+        "2024-W05-3",
+        "2024-01-31 10:00:00",
+        datetime.datetime(2024, 1, 31, 10),
+        20240131,
+        None,
+    ],
+)
+def test_validate_configuration__invalid_release_date(release_date):
+    """Tests, if an invalid release-date is reported with the path of the parameter."""
+    config = {
+        "global_config": {
+            "git_user_name": "a",
+            "git_user_email": "b",
+            "release_date": release_date,
+        },
+        "repositories": {},
+    }
+    with pytest.raises(configuration.ConfigurationHandlerException) as exc_info:
+        configuration.validate_configuration(config)
+    assert "global_config/release_date" in exc_info.value.args[0]
+
+
+def test_global_config__release_date_is_normalised():
+    """Tests, if a release-date parsed by yaml as date is converted into the format YYYY-MM-DD."""
+    global_config = configuration.GlobalConfig.from_dict(
+        {"git_user_name": "a", "git_user_email": "b", "release_date": datetime.date(2024, 1, 31)}
+    )
+    assert global_config.release_date == "2024-01-31"
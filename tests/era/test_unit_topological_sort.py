@@ -40,3 +40,47 @@ def test_error_on_bidirectional_relation():
         configuration.get_file_configuration(configuration_path)
     # these asserts are identical; you can use either one
     assert "NOTE: No circular relations allowed." in exc_info.value.args[0]
+
+
+def test_error_on_self_relation():
+    """Tests, if the ERA's topological sort raises an exception, if a single repository depends on
+    itself."""
+
+    current_directory = pathlib.Path(__file__).parent.resolve()
+    configuration_path = current_directory / "configurations/test_config_self_relation.yaml"
+
+    with pytest.raises(configuration.ConfigurationHandlerException) as exc_info:
+        configuration.get_file_configuration(configuration_path)
+    assert "NOTE: No circular relations allowed." in exc_info.value.args[0]
+
+
+def test_topological_sort__without_dependencies(caplog: pytest.LogCaptureFixture):
+    """Tests, if release-entries without dependencies keep their order, and the sorted
+    release-entries are logged nonetheless."""
+    release_entries = [
+        configuration.ReleaseEntry(
+            name,
+            configuration.PublicReleaseEntry(name, "_"),
+            configuration.PrivateReleaseEntry(),
+            configuration.PluginEntries(),
+        )
+        for name in ("package_2", "package_1")
+    ]
+
+    with caplog.at_level("INFO"):
+        sorted_entries = configuration.topological_sort(release_entries)
+    assert sorted_entries == release_entries
+    assert "Successfully sorted release-entries: ['package_2', 'package_1']" in caplog.messages
+
+
+def test_group_by_dependency_level():
+    """Tests, if the release-entries are grouped into levels, whose entries solely depend on entries
+    of previous levels."""
+    current_directory = pathlib.Path(__file__).parent.resolve()
+    configuration_path = current_directory / "configurations/test_config_default.yaml"
+
+    _, release_entries = configuration.get_file_configuration(configuration_path)
+    levels = configuration.group_by_dependency_level(release_entries)
+
+    level_names = [sorted(entry.name for entry in level) for level in levels]
+    assert level_names == [["package_3", "package_4"], ["package_2"], ["package_1"]]
@@ -0,0 +1,50 @@
+"""Tests for YamlHandler
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import pathlib
+
+import pytest
+
+from easy_release_automation.core.utils import yaml_handler
+
+
+def test_yaml_handler__cached_config_is_not_shared(tmp_path: pathlib.Path):
+    """Tests, if a repeatedly read configuration is served from the cache, and modifications of the
+    returned configuration do not affect the cached configuration."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("repositories:\n  package_1:\n    url: '_'\n")
+
+    first_config = yaml_handler.YamlHandler.get_config(str(config_file))
+    first_config["repositories"]["package_1"]["name"] = "package_1"
+    second_config = yaml_handler.YamlHandler.get_config(str(config_file))
+
+    assert second_config == {"repositories": {"package_1": {"url": "_"}}}
+
+
+def test_yaml_handler__modified_config_is_read_again(tmp_path: pathlib.Path):
+    """Tests, if a modified configuration file is parsed again instead of using the cache."""
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("key: 1\n")
+    assert yaml_handler.YamlHandler.get_config(str(config_file)) == {"key": 1}
+
+    config_file.write_text("key: 2\n")
+    stat_result = config_file.stat()
+    os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+
+    assert yaml_handler.YamlHandler.get_config(str(config_file)) == {"key": 2}
+
+
+def test_yaml_handler__missing_config(tmp_path: pathlib.Path):
+    """Tests, if an InvalidConfPathError is raised, if the configuration file does not exist."""
+    with pytest.raises(yaml_handler.InvalidConfPathError):
+        yaml_handler.YamlHandler.get_config(str(tmp_path / "missing.yml"))
+    with pytest.raises(yaml_handler.InvalidConfPathError):
+        yaml_handler.YamlHandler.get_config(str(tmp_path))
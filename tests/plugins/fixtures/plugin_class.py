@@ -0,0 +1,24 @@
+"""Pytest Fixture for the plugin class of a test module
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import pytest
+
+from easy_release_automation.core import plugin_executor
+from tests.plugins.utils import plugin_loader
+
+
+@pytest.fixture
+def plugin_class(request: pytest.FixtureRequest) -> type:
+    """Fixture for the modification plugin class named by ENTRY_POINT_NAME of the test module.
+    Ensures, that the entrypoint is configured correctly. The loaded classes are cached by the
+    plugin loader."""
+    return plugin_loader.load_plugin_class(
+        request.module.ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
+    )
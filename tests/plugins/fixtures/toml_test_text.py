@@ -0,0 +1,18 @@
+"""Pytest Fixture for the toml test-file of a test module
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def toml_test_text(request: pytest.FixtureRequest) -> str:
+    """Fixture for the content of the TOML_TEST_FILE of the test module, which is solely read once
+    per module."""
+    return request.module.TOML_TEST_FILE.read_text()
@@ -0,0 +1,22 @@
+"""Pytest Fixture for the working directory of the plugin test-files
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import pathlib
+
+import pytest
+
+
+@pytest.fixture
+def work_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Fixture for an already created sub-directory of the repository directory (tmp_path), so that
+    the plugins are tested with relative file paths including a directory."""
+    work_dir = tmp_path / "some_dir"
+    work_dir.mkdir()
+    return work_dir
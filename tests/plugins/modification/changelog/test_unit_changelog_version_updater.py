@@ -79,3 +79,20 @@ def test_changelog_version_updater__changelog_is_unreleased(
 
     assert CHANGELOG_UNRELEASED_ENTRY not in result
     assert "## [1.2.3] - " in result
+
+
+def test_changelog_version_updater__release_date(
+    tmp_path: pathlib.Path, default_global_config: GlobalConfig, default_release_entry: ReleaseEntry
+):
+    """Tests, if the release date of the global configuration is used for the release entry."""
+
+    test_file = tmp_path / "CHANGELOG.md"
+    test_file.write_text(CHANGELOG_HEADER + CHANGELOG_UNRELEASED_ENTRY)
+    default_global_config.release_date = "2024-10-03"
+
+    plugin = changelog_version_updater.ChangelogVersionUpdaterPlugin(
+        default_release_entry, default_global_config, tmp_path
+    )
+    plugin.run(test_file.name, version="1.2.3")
+
+    assert "## [1.2.3] - 2024-10-03\n" in test_file.read_text(encoding="utf-8")
@@ -0,0 +1,122 @@
+"""Tests for the plain YAML fast-path
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import concurrent.futures
+import io
+import pathlib
+
+import pytest
+import ruamel.yaml
+
+from easy_release_automation.plugins.modification.configuration_files import plain_yaml
+
+
+@pytest.mark.parametrize(
+    "yaml_string",
+    [
+        "",
+        "a:\n  b: 21\n  c: test\n",
+        "version: 1.2.3\nname: ümlaut\n",
+        "l:\n- a: 1\n  b: 2\n- c\n",
+    ],
+)
+def test_plain_yaml__matches_round_trip(yaml_string: str):
+    """Tests, if plain yaml-files are parsed and dumped identically to the round-trip parser."""
+    yaml = ruamel.yaml.YAML()
+    round_trip_stream = io.StringIO()
+    yaml.dump(yaml.load(yaml_string) or {}, round_trip_stream)
+
+    config = plain_yaml.load(yaml_string.encode())
+
+    assert config is not None
+    assert plain_yaml.dump(config) == round_trip_stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "yaml_string",
+    [
+        "# comment\na: 1\n",
+        "a: &anchor 1\nb: *anchor\n",
+        "on: push\n",
+        "a: no\n",
+        "mode: 0755\n",
+        "version: 1.10\n",
+        "time: 12:30\n",
+        "date: 2024-01-01 10:00:00\n",
+        "a:\n  b:\n",
+        "a: [1, 2]\n",
+        "m: |\n  text\n",
+        "long: " + "word " * 20 + "\n",
+        "- a\n",
+        "a: b: c\n",
+        "a:\n  b: 1\n\n\nc: 2\n",
+        "a: 0x1F\n",
+        'a: "line1\\nline2"\n',
+        "a: 'yes'\n",
+        "s: 'quoted: yes'\nt: \"double quoted\"\n",
+    ],
+)
+def test_plain_yaml__falls_back(yaml_string: str):
+    """Tests, if yaml-files, that cannot be reproduced by PyYAML, are left to the round-trip
+    parser."""
+    assert plain_yaml.load(yaml_string.encode()) is None
+
+
+@pytest.mark.parametrize(
+    "yaml_string",
+    ["a:\n  b: 1\n\n\nc: 2\n", "a: 0x1F\n", 'a: "line1\\nline2"\n', "a: 'yes'\n"],
+)
+def test_plain_yaml__update_file_preserves_formatting(tmp_path: pathlib.Path, yaml_string: str):
+    """Tests, if updated yaml-files, that are not plain, are written like the round-trip parser
+    writes them."""
+    yaml_file = tmp_path / "test.yml"
+    yaml_file.write_text(yaml_string)
+
+    def update(existing_config: dict) -> dict:
+        existing_config["new"] = 1
+        return existing_config
+
+    plain_yaml.update_file(yaml_file, update)
+
+    yaml = ruamel.yaml.YAML()
+    round_trip_config = yaml.load(yaml_string)
+    round_trip_config["new"] = 1
+    round_trip_stream = io.StringIO()
+    yaml.dump(round_trip_config, round_trip_stream)
+    assert yaml_file.read_text() == round_trip_stream.getvalue()
+
+
+@pytest.mark.parametrize("value", ["1e3", "0o17", "yes", None])
+def test_plain_yaml__update_file_with_ambiguous_values(tmp_path: pathlib.Path, value):
+    """Tests, if plain yaml-files, whose updated values are not plain, are written like the
+    round-trip parser writes them, so that the values are read back unchanged."""
+    yaml_file = tmp_path / "test.yml"
+    yaml_file.write_text("a: b\nc: d\n")
+
+    def update(existing_config: dict) -> dict:
+        existing_config["a"] = value
+        return existing_config
+
+    plain_yaml.update_file(yaml_file, update)
+
+    yaml = ruamel.yaml.YAML()
+    round_trip_stream = io.StringIO()
+    yaml.dump({"a": value, "c": "d"}, round_trip_stream)
+    assert yaml_file.read_text() == round_trip_stream.getvalue()
+    assert yaml.load(yaml_file.read_text()) == {"a": value, "c": "d"}
+
+
+def test_plain_yaml__round_trip_yaml_per_thread():
+    """Tests, if the round-trip parser is reused within a thread, but not shared across threads."""
+    round_trip_yaml = plain_yaml.get_round_trip_yaml()
+    assert plain_yaml.get_round_trip_yaml() is round_trip_yaml
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(plain_yaml.get_round_trip_yaml).result() is not round_trip_yaml
@@ -65,3 +65,66 @@ def test_cfg_file_updater__file_exists(
     result = test_file.read_text(encoding="utf-8")
     # Ignore spaces
     assert result.replace(" ", "").strip() == expected_output.replace(" ", "").strip()
+
+
+def test_cfg_file_updater__unchanged_file_is_not_rewritten(
+    tmp_path: pathlib.Path, cfg_file_updater_plugin: raw_cfg_file_updater.RAWCfgUpdaterPlugin
+):
+    """Tests, if the cfg-file is left untouched, if all parameters are already up to date."""
+
+    test_file = tmp_path / "test.cfg"
+    config_content = '# Here is a comment A\nCONFIG_PARAM_A="test"\nCONFIG_PARAM_B = 21\n'
+    test_file.write_text(config_content)
+
+    cfg_file_updater_plugin.run(test_file.name, {"CONFIG_PARAM_A": "test", "CONFIG_PARAM_B": 21})
+
+    assert test_file.read_text(encoding="utf-8") == config_content
+
+
+def test_cfg_file_updater__other_lines_persist(
+    tmp_path: pathlib.Path, cfg_file_updater_plugin: raw_cfg_file_updater.RAWCfgUpdaterPlugin
+):
+    """Tests, if solely the updated parameters are rewritten, and new parameters are appended."""
+
+    test_file = tmp_path / "test.cfg"
+    test_file.write_text(
+        "# comment\nCONFIG_PARAM_A:'1'\n# comment\n  CONFIG_PARAM_AB =  2\nCONFIG_PARAM_C=\\x"
+    )
+
+    cfg_file_updater_plugin.run(
+        test_file.name,
+        {"CONFIG_PARAM_A": "\\1", "CONFIG_PARAM_C": "\\x", "CONFIG_PARAM_D": 4},
+        False,
+    )
+
+    assert test_file.read_text(encoding="utf-8") == (
+        "# comment\nCONFIG_PARAM_A:\\1\n# comment\n  CONFIG_PARAM_AB =  2\nCONFIG_PARAM_C=\\x\n"
+        "CONFIG_PARAM_D = 4\n"
+    )
+
+
+def test_cfg_file_updater__sections_are_not_updated(
+    tmp_path: pathlib.Path, cfg_file_updater_plugin: raw_cfg_file_updater.RAWCfgUpdaterPlugin
+):
+    """Tests, if solely the top-level parameter is updated, and not the parameters of sections with
+    the same name."""
+
+    test_file = tmp_path / "test.cfg"
+    test_file.write_text("version = 1\n[metadata]\nversion = 1\n")
+
+    cfg_file_updater_plugin.run(test_file.name, {"version": 2}, False)
+
+    assert test_file.read_text(encoding="utf-8") == "version = 2\n[metadata]\nversion = 1\n"
+
+
+def test_cfg_file_updater__new_parameters_before_sections(
+    tmp_path: pathlib.Path, cfg_file_updater_plugin: raw_cfg_file_updater.RAWCfgUpdaterPlugin
+):
+    """Tests, if new parameters are inserted as top-level parameters before the first section."""
+
+    test_file = tmp_path / "test.cfg"
+    test_file.write_text("# comment\n[metadata]\nname = x\n")
+
+    cfg_file_updater_plugin.run(test_file.name, {"name": "y"}, False)
+
+    assert test_file.read_text(encoding="utf-8") == "# comment\nname = y\n[metadata]\nname = x\n"
@@ -73,3 +73,41 @@ def test_yaml_file_updater__file_exists(
     assert raw_text.count("# this is a comment") == 2
     result = yaml.load(raw_text, Loader=yaml.CLoader)
     assert not deepdiff.DeepDiff(expected_output, result, ignore_order=True)
+
+
+def test_yaml_file_updater__dictionary_values_are_replaced(
+    tmp_path: pathlib.Path, yaml_file_updater_plugin: yaml_file_updater.YamlUpdaterPlugin
+):
+    """Tests, if dictionary values replace the existing values instead of being merged."""
+
+    test_file = tmp_path / "test.yml"
+    test_file.write_text("a:\n  b:\n    c: 1\n    d: 2\n")
+
+    yaml_file_updater_plugin.run(test_file.name, {"a/b": {"c": 3}})
+
+    assert yaml.load(test_file.read_text(encoding="utf-8"), Loader=yaml.CLoader) == {
+        "a": {"b": {"c": 3}}
+    }
+
+
+def test_yaml_file_updater__yaml_1_2_values_persist(
+    tmp_path: pathlib.Path, yaml_file_updater_plugin: yaml_file_updater.YamlUpdaterPlugin
+):
+    """Tests, if values, that are interpreted differently by YAML 1.1, are kept as they are."""
+
+    test_file = tmp_path / "test.yml"
+    test_file.write_text("on: push\nversion: 1.10\n")
+
+    yaml_file_updater_plugin.run(test_file.name, {"name": "era"})
+
+    assert test_file.read_text(encoding="utf-8") == "on: push\nversion: 1.10\nname: era\n"
+
+
+def test_yaml_file_updater__empty_configuration(
+    tmp_path: pathlib.Path, yaml_file_updater_plugin: yaml_file_updater.YamlUpdaterPlugin
+):
+    """Tests, if the yaml-file is neither read nor generated, if no parameters are given."""
+
+    yaml_file_updater_plugin.run("test.yml", {})
+
+    assert not (tmp_path / "test.yml").exists()
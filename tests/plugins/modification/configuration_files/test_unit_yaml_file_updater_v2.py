@@ -79,3 +79,17 @@ def test_yaml_file_updater__file_exists(
     assert raw_text.count("# this is a comment") == 2
     result = yaml.load(raw_text, Loader=yaml.CLoader)
     assert not deepdiff.DeepDiff(expected_output, result, ignore_order=True)
+
+
+def test_yaml_file_updater__unchanged_file_is_not_rewritten(
+    tmp_path: pathlib.Path, yaml_update_v2_plugin: yaml_file_updater_v2.YamlUpdateV2Plugin
+):
+    """Tests, if the yaml-file is left untouched, if the configuration is already up to date."""
+
+    test_file = tmp_path / "test.yml"
+    yaml_content = "# comment\na:   {b: 0}\n"
+    test_file.write_text(yaml_content)
+
+    yaml_update_v2_plugin.run(test_file.name, {"a": {"b": 0}})
+
+    assert test_file.read_text(encoding="utf-8") == yaml_content
@@ -10,53 +10,55 @@ SPDX-License-Identifier: MIT
 
 import pathlib
 
+import pytest
+
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.plugins.modification.python_requirements import (
     requirements_updater_and_compiler,
 )
-from easy_release_automation.core import plugin_executor
 from tests.plugins.fixtures.default_config import default_global_config, default_release_entry
-from tests.plugins.utils import plugin_loader
+from tests.plugins.fixtures.plugin_class import plugin_class
+from tests.plugins.fixtures.toml_test_text import toml_test_text
+from tests.plugins.fixtures.work_dir import work_dir
 
 ENTRY_POINT_NAME = "update_and_compile_requirements"
 
+
 TOML_TEST_FILE = pathlib.Path(__file__).parent / "test_files/compile_pyproject.toml"
 
 
+@pytest.mark.parametrize("parallel_compilation", [False, True])
 def test_requirements_updater_and_compiler__compile_toml_file(
     tmp_path: pathlib.Path,
+    work_dir: pathlib.Path,
     default_release_entry: ReleaseEntry,
     default_global_config: GlobalConfig,
+    toml_test_text: str,
+    plugin_class: type,
+    parallel_compilation: bool,
 ):
-    """Tests the generation of the requirement-files for a pyproject.toml.
+    """Tests the generation of the requirement-files for a pyproject.toml, if the extras are
+    compiled sequentially or concurrently.
     NOTE: it does not validate the output requirement-files. Only ensures their generation.
     NOTE: it does not test the requirements updates, as there are specific tests for the
     RequirementsUpdaterPlugin.
     """
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
-
     # Define input toml
-    toml_input = TOML_TEST_FILE.read_text()
-    toml_file = tmp_path / "some_dir" / "pyproject.toml"
-    toml_file.parent.mkdir()
+    toml_input = toml_test_text
+    toml_file = work_dir / "pyproject.toml"
     toml_file.write_text(toml_input)
 
     # Instantiate Class
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
     plugin = plugin_class(default_release_entry, default_global_config, tmp_path)
     assert isinstance(
         plugin, requirements_updater_and_compiler.RequirementsUpdaterAndCompilerPlugin
     )
     # Run Plugin on requirements.txt
-    plugin.run([str(toml_file.relative_to(tmp_path))])
+    plugin.run([str(toml_file.relative_to(tmp_path))], parallel_compilation=parallel_compilation)
 
-    # Validate, if requirement-files were generated. Would raise an IterationStop exception, if not.
-    next(toml_file.parent.glob("requirements.txt"))
-    next(toml_file.parent.glob("requirements-test.txt"))
+    # Validate, if requirement-files were generated.
+    assert (toml_file.parent / "requirements.txt").exists()
+    assert (toml_file.parent / "requirements-test.txt").exists()
 
 
 REQUIREMENTS_ENTRY = "pip==24.0"
@@ -64,29 +66,23 @@ REQUIREMENTS_ENTRY = "pip==24.0"
 
 def test_requirements_updater_and_compiler__compile_requirements_file(
     tmp_path: pathlib.Path,
+    work_dir: pathlib.Path,
     default_release_entry: ReleaseEntry,
     default_global_config: GlobalConfig,
+    plugin_class: type,
 ):
     """Tests the generation of the requirement-files for a requirements.in.
     NOTE: it does not validate the output requirement-files. Only ensures their generation.
     NOTE: it does not test the requirements updates, as there are specific tests for the
     RequirementsUpdaterPlugin.
     """
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
-
     # Define input requirements
-    requirements_file = tmp_path / "some_dir" / "requirements.in"
-    requirements_file.parent.mkdir()
+    requirements_file = work_dir / "requirements.in"
     requirements_file.write_text(REQUIREMENTS_ENTRY)
     requirements_test_file = requirements_file.parent / "requirements-test.in"
     requirements_test_file.write_text(REQUIREMENTS_ENTRY)
 
     # Instantiate Class
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
     plugin = plugin_class(default_release_entry, default_global_config, tmp_path)
     assert isinstance(
         plugin, requirements_updater_and_compiler.RequirementsUpdaterAndCompilerPlugin
@@ -99,6 +95,6 @@ def test_requirements_updater_and_compiler__compile_requirements_file(
         ]
     )
 
-    # Validate, if requirement-files were generated. Would raise an IterationStop exception, if not.
-    next(requirements_file.parent.glob("requirements.txt"))
-    next(requirements_file.parent.glob("requirements-test.txt"))
+    # Validate, if requirement-files were generated.
+    assert (requirements_file.parent / "requirements.txt").exists()
+    assert (requirements_file.parent / "requirements-test.txt").exists()
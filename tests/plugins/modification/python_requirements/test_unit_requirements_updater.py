@@ -18,81 +18,97 @@ from easy_release_automation.core.configuration import (
     ReleaseEntry,
 )
 from easy_release_automation.plugins.modification.python_requirements import requirements_updater
-from easy_release_automation.core import plugin_executor
 from tests.plugins.fixtures.default_config import default_global_config, default_release_entry
-from tests.plugins.utils import plugin_loader
+from tests.plugins.fixtures.plugin_class import plugin_class
+from tests.plugins.fixtures.toml_test_text import toml_test_text
+from tests.plugins.fixtures.work_dir import work_dir
 
 ENTRY_POINT_NAME = "update_requirements"
 
+
 DEP_REPO_1 = PublicReleaseEntry("my-dep-repo-1", "github.com/my-org/my-dep-repo-1", "v1.2.1")
 DEP_REPO_2 = PublicReleaseEntry("my-dep-repo-2", "github.com/my-org/my-dep-repo-2", "12.1.2")
 
 REQ_FILE = """# some comment
-%s # some comment
+{} # some comment
 # some comment
 some-independent-repo==0.23.4 # some comment
 """
 REQ_FILE_2_DEP = """# some comment
-%s # some comment
+{} # some comment
 # some comment
 some-independent-repo==0.23.4 # some comment
-%s # some comment
+{} # some comment
 """
 
 
 @pytest.mark.parametrize(
     "input_content, output_content",
     [
-        (  # Using HTTPS protocol identifier
+        pytest.param(
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+https://{DEP_REPO_1.url}@v2.34.63"),
             REQ_FILE.format(
                 f"{DEP_REPO_1.name} @ git+https://{DEP_REPO_1.url}@{DEP_REPO_1.version}"
             ),
+            id="https",
         ),
-        (  # Version pinning with repository @
+        pytest.param(
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}@v2.34.63"),
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="version-with-name",
         ),
-        (  # Branch reference with repository @
+        pytest.param(
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}@my_branch"),
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="branch-with-name",
         ),
-        (  # No pinning with repository @
+        pytest.param(
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}"),
             REQ_FILE.format(f"{DEP_REPO_1.name} @ git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="no-pinning-with-name",
+        ),
+        pytest.param(
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}@2.1.3"),
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="version-without-name",
+        ),
+        pytest.param(
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}@my_branch"),
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="branch-without-name",
         ),
-        (  # Version pinning without repository @
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}@2.1.3"),
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}@{DEP_REPO_1.version}"),
+        pytest.param(
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}"),
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}@{DEP_REPO_1.version}"),
+            id="no-pinning-without-name",
         ),
-        (  # Branch reference without repository @
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}@my_branch"),
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}@{DEP_REPO_1.version}"),
+        pytest.param(
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}.git@my_branch;python_version<'3.10'"),
+            REQ_FILE.format(
+                f"git+ssh://{DEP_REPO_1.url}.git@{DEP_REPO_1.version};python_version<'3.10'"
+            ),
+            id="environment-marker",
         ),
-        (  # No pinning without repository @
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}"),
-            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.name}@{DEP_REPO_1.version}"),
+        pytest.param(
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}0@my_branch"),
+            REQ_FILE.format(f"git+ssh://{DEP_REPO_1.url}0@my_branch"),
+            id="similar-url",
         ),
     ],
 )
 def test_requirements_updater__requirements_file_different_variations(
     tmp_path: pathlib.Path,
+    work_dir: pathlib.Path,
     output_content: str,
     input_content: str,
     default_release_entry: ReleaseEntry,
     default_global_config: GlobalConfig,
+    plugin_class: type,
 ):
     """Tests different variations of requirement entries."""
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
-    requirements_file = tmp_path / "some_dir" / "my-requirements.in"
-    requirements_file.parent.mkdir()
-    requirements_file.write_text(input_content)
+    requirements_file = work_dir / "my-requirements.in"
+    requirements_file.write_bytes(input_content.encode("utf-8"))
 
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
     # Add dependencies
     default_release_entry.private.dependencies[DEP_REPO_1.name] = DEP_REPO_1
 
@@ -102,30 +118,25 @@ def test_requirements_updater__requirements_file_different_variations(
 
     # Run Plugin on requirements.txt
     plugin.run([str(requirements_file.relative_to(tmp_path))])
-    assert output_content == requirements_file.read_text()
+    assert output_content.encode("utf-8") == requirements_file.read_bytes()
 
 
 def test_requirements_updater__requirements_file_two_dependencies(
     tmp_path: pathlib.Path,
+    work_dir: pathlib.Path,
     default_release_entry: ReleaseEntry,
     default_global_config: GlobalConfig,
+    plugin_class: type,
 ):
     """Tests the behavior on multiple requirement entries in a requirements.txt file."""
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
-    requirements_file = tmp_path / "some_dir" / "my-requirements.in"
-    requirements_file.parent.mkdir()
+    requirements_file = work_dir / "my-requirements.in"
 
-    input_content = REQ_FILE_2_DEP.format(f"git+{DEP_REPO_1.name}@2.1.3", f"git+{DEP_REPO_1.name}")
+    input_content = REQ_FILE_2_DEP.format(f"git+{DEP_REPO_1.url}@2.1.3", f"git+{DEP_REPO_2.url}")
     output_content = REQ_FILE_2_DEP.format(
-        f"git+{DEP_REPO_1.name}@{DEP_REPO_1.version}", f"git+{DEP_REPO_2.name}@{DEP_REPO_2.version}"
+        f"git+{DEP_REPO_1.url}@{DEP_REPO_1.version}", f"git+{DEP_REPO_2.url}@{DEP_REPO_2.version}"
     )
-    requirements_file.write_text(input_content)
+    requirements_file.write_bytes(input_content.encode("utf-8"))
 
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
     # Add dependencies
     default_release_entry.private.dependencies[DEP_REPO_1.name] = DEP_REPO_1
     default_release_entry.private.dependencies[DEP_REPO_2.name] = DEP_REPO_2
@@ -136,7 +147,34 @@ def test_requirements_updater__requirements_file_two_dependencies(
 
     # Run Plugin on requirements.txt
     plugin.run([str(requirements_file.relative_to(tmp_path))])
-    assert output_content == requirements_file.read_text()
+    assert output_content.encode("utf-8") == requirements_file.read_bytes()
+
+
+def test_requirements_updater__dependencies_updated_in_single_pass(
+    tmp_path: pathlib.Path,
+    default_release_entry: ReleaseEntry,
+    default_global_config: GlobalConfig,
+    plugin_class: type,
+):
+    """Tests, if all dependencies of a requirements file are updated with their own reference, and
+    unrelated entries are kept."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text(
+        f"{DEP_REPO_2.name} @ git+ssh://{DEP_REPO_2.url}.git@my_branch\n"
+        "some-independent-repo==0.23.4\n"
+        f"{DEP_REPO_1.name} @ git+https://{DEP_REPO_1.url.upper()}\n"
+    )
+    default_release_entry.private.dependencies[DEP_REPO_1.name] = DEP_REPO_1
+    default_release_entry.private.dependencies[DEP_REPO_2.name] = DEP_REPO_2
+
+    plugin = plugin_class(default_release_entry, default_global_config, tmp_path)
+    plugin.run(["requirements.txt"])
+
+    assert requirements_file.read_text() == (
+        f"{DEP_REPO_2.name} @ git+ssh://{DEP_REPO_2.url}.git@{DEP_REPO_2.version}\n"
+        "some-independent-repo==0.23.4\n"
+        f"{DEP_REPO_1.name} @ git+https://{DEP_REPO_1.url.upper()}@{DEP_REPO_1.version}\n"
+    )
 
 
 TOML_REQUIREMENT_1 = f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@{DEP_REPO_1.version}"
@@ -148,49 +186,50 @@ TOML_TEST_FILE = pathlib.Path(__file__).parent / "test_files/requirement_update_
 @pytest.mark.parametrize(
     "main_dep_before, main_dep_after, opt_dep_before, opt_dep_after",
     [
-        (  # Version reference beforehand
+        pytest.param(
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@v2.34.63",
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@{DEP_REPO_1.version}",
             f"git+{DEP_REPO_2.url}@v2.34.63",
             f"git+{DEP_REPO_2.url}@{DEP_REPO_2.version}",
+            id="version",
         ),
-        (  # Branch reference beforehand
+        pytest.param(
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@my_branch",
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@{DEP_REPO_1.version}",
             f"git+{DEP_REPO_2.url}@my_branch",
             f"git+{DEP_REPO_2.url}@{DEP_REPO_2.version}",
+            id="branch",
         ),
-        (  # No pinning beforehand
+        pytest.param(
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}",
             f"{DEP_REPO_1.name} @ git+{DEP_REPO_1.url}@{DEP_REPO_1.version}",
             f"git+{DEP_REPO_2.url}",
             f"git+{DEP_REPO_2.url}@{DEP_REPO_2.version}",
+            id="no-pinning",
         ),
     ],
 )
 def test_requirements_updater__toml_file_two_dependencies(
     tmp_path: pathlib.Path,
+    work_dir: pathlib.Path,
     default_release_entry: ReleaseEntry,
     default_global_config: GlobalConfig,
     main_dep_before: str,
     main_dep_after: str,
     opt_dep_before: str,
     opt_dep_after: str,
+    toml_test_text: str,
+    plugin_class: type,
 ):
     """Tests the behavior on multiple requirement entries in a toml-file."""
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
-
     # Define input toml
-    toml_input = TOML_TEST_FILE.read_text()
+    toml_input = toml_test_text
     toml_input = toml_input.replace("{ OPTIONAL-TEST-DEPENDENCY }", opt_dep_before)
     toml_input = toml_input.replace("{ MAIN-DEPENDENCY }", main_dep_before)
-    toml_file = tmp_path / "some_dir" / "my-requirements.toml"
-    toml_file.parent.mkdir()
+    toml_file = work_dir / "my-requirements.toml"
     toml_file.write_text(toml_input)
     # Define output toml
-    toml_output = TOML_TEST_FILE.read_text()
+    toml_output = toml_test_text
     toml_output = toml_output.replace("{ OPTIONAL-TEST-DEPENDENCY }", opt_dep_after)
     toml_output = toml_output.replace("{ MAIN-DEPENDENCY }", main_dep_after)
 
@@ -198,9 +237,6 @@ def test_requirements_updater__toml_file_two_dependencies(
     default_release_entry.private.dependencies[DEP_REPO_1.name] = DEP_REPO_1
     default_release_entry.private.dependencies[DEP_REPO_2.name] = DEP_REPO_2
     # Instantiate Class
-    plugin_class = plugin_loader.load_plugin_class(
-        ENTRY_POINT_NAME, plugin_executor.MODIFICATION_ENTRYPOINT_GROUP
-    )
     plugin = plugin_class(default_release_entry, default_global_config, tmp_path)
     assert isinstance(plugin, requirements_updater.RequirementsUpdaterPlugin)
     # Run Plugin on requirements.txt
@@ -208,3 +244,30 @@ def test_requirements_updater__toml_file_two_dependencies(
 
     # Validate
     assert toml_output == toml_file.read_text()
+
+
+@pytest.mark.skipif(not requirements_updater.HAS_TOMLLIB, reason="requires tomllib")
+def test_requirements_updater__up_to_date_toml_file_is_not_rewritten(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    default_release_entry: ReleaseEntry,
+    default_global_config: GlobalConfig,
+    toml_test_text: str,
+    plugin_class: type,
+):
+    """Tests, if the style-preserving round-trip is skipped, if all dependencies are up to date."""
+    toml_input = toml_test_text
+    toml_input = toml_input.replace("{ OPTIONAL-TEST-DEPENDENCY }", "pyyaml>=6.0")
+    toml_input = toml_input.replace("{ MAIN-DEPENDENCY }", TOML_REQUIREMENT_1)
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text(toml_input)
+
+    def read_pyproject_toml(file_path: pathlib.Path):
+        raise AssertionError(f"{file_path} must not be parsed with tomlkit.")
+
+    monkeypatch.setattr(plugin_class, "read_pyproject_toml", read_pyproject_toml)
+    default_release_entry.private.dependencies[DEP_REPO_1.name] = DEP_REPO_1
+    plugin = plugin_class(default_release_entry, default_global_config, tmp_path)
+    plugin.run([toml_file.name])
+
+    assert toml_file.read_text() == toml_input
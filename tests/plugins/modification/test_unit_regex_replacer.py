@@ -9,6 +9,7 @@ SPDX-License-Identifier: MIT
 """
 
 import pathlib
+import re
 from typing import Union
 
 import pytest
@@ -22,6 +23,24 @@ from ..fixtures.default_config import default_global_config, default_release_ent
 
 ENTRY_POINT_NAME = "regex_replacer"
 
+STR_1 = '"pyproject"=="1.2.43"'
+STR_2 = '"pyproject"=="49.12.233"'
+STR_3 = '"pyproject"=="123.12.233"'
+
+FILE_CONTENT = f"""
+        Lorem ipsum dolor sit amet, consectetur adipisici elit, 
+        sed eiusmod tempor incidunt ut labore et dolore magna aliqua
+
+        {STR_1} Lorem ipsum dolor sit amet
+
+        {STR_2}Lorem ipsum dolor sit amet
+
+        {STR_3}Lorem ipsum dolor sit amet  
+
+        Lorem ipsum dolor sit amet\
+    """
+ENCODED_FILE_CONTENT = FILE_CONTENT.encode("utf-8")
+
 
 @pytest.fixture
 def regex_replacer_plugin(
@@ -37,12 +56,20 @@ def regex_replacer_plugin(
     return plugin
 
 
+@pytest.fixture
+def test_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Fixture for the test-file with the module-level file content."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes(ENCODED_FILE_CONTENT)
+    return test_file
+
+
 # Test, if the replacement counts are respected.
 @pytest.mark.parametrize("replacement_count", [0, 1, 2, 3])
 # Test, if replacements strings and lists are handled as expected
 @pytest.mark.parametrize("replacement", ['"pyproject"=="iGotReplaced"', ["I", "GOT", "Repl"]])
 def test_regex_replacer__various_replacement_configurations(
-    tmp_path: pathlib.Path,
+    test_file: pathlib.Path,
     replacement_count: int,
     replacement: Union[str, list[str]],
     regex_replacer_plugin: regex_replacer.RegexReplacerPlugin,
@@ -52,37 +79,109 @@ def test_regex_replacer__various_replacement_configurations(
     - the the string is replaced correctly
     """
 
-    str_1 = '"pyproject"=="1.2.43"'
-    str_2 = '"pyproject"=="49.12.233"'
-    str_3 = '"pyproject"=="123.12.233"'
+    repository_dir = test_file.parent
 
-    file_content = f"""
-        Lorem ipsum dolor sit amet, consectetur adipisici elit, 
-        sed eiusmod tempor incidunt ut labore et dolore magna aliqua
+    relative_path = test_file.relative_to(repository_dir)
 
-        {str_1} Lorem ipsum dolor sit amet
+    replacement_str = "".join(replacement) if isinstance(replacement, list) else replacement
+    regex_replacer_plugin.run(
+        str(relative_path), r'"pyproject"=="\d+\.\d+\.\d+"', replacement, replacement_count
+    )
 
-        {str_2}Lorem ipsum dolor sit amet
+    result = test_file.read_text(encoding="utf-8")
+    assert result.count(replacement_str) == (replacement_count if replacement_count != 0 else 3)
+    assert result.count(STR_1) == 0
+    assert result.count(STR_2) == (0 if replacement_count in [0, 2, 3] else 1)
+    assert result.count(STR_3) == (0 if replacement_count in [0, 3] else 1)
 
-        {str_3}Lorem ipsum dolor sit amet  
 
-        Lorem ipsum dolor sit amet\
-    """
+def test_regex_replacer__compiled_pattern(
+    tmp_path: pathlib.Path, regex_replacer_plugin: regex_replacer.RegexReplacerPlugin
+):
+    """Tests, if an already compiled pattern is used as it is."""
+    pattern = re.compile(r"(?m)^version = .+$")
+    assert regex_replacer_plugin.compile_regex(pattern) is pattern
 
     test_file = tmp_path / "test.txt"
-    test_file.write_text(file_content, encoding="utf-8")
+    test_file.write_text("name = era\nversion = 1.0.0\n", encoding="utf-8")
+    regex_replacer_plugin.run("test.txt", pattern, "version = 1.1.0")
 
-    repository_dir = test_file.parent
+    assert test_file.read_text(encoding="utf-8") == "name = era\nversion = 1.1.0\n"
 
-    relative_path = test_file.relative_to(repository_dir)
 
-    replacement_str = "".join(replacement) if isinstance(replacement, list) else replacement
-    regex_replacer_plugin.run(
-        str(relative_path), '"pyproject"=="\d+\.\d+\.\d+"', replacement, replacement_count
-    )
+def test_regex_replacer__binary_pattern(
+    tmp_path: pathlib.Path, regex_replacer_plugin: regex_replacer.RegexReplacerPlugin
+):
+    """Tests, if a pattern compiled from bytes is applied on the raw file content."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes("name = ärä\r\nversion = 1.0.0\r\n".encode())
+    regex_replacer_plugin.run("test.txt", re.compile(rb"(?m)^version = .+\r$"), "version = 1.1.0\r")
+
+    assert test_file.read_bytes() == "name = ärä\r\nversion = 1.1.0\r\n".encode()
+
+
+@pytest.mark.parametrize(
+    "regex, replacement, replacement_count, expected_content",
+    [
+        ("version = 1", "version = 2", 1, "version = 2\nversion = 1\n"),
+        ("version = 1", "version = 2", 0, "version = 2\nversion = 2\n"),
+        ("version = 1", r"version\n= 2", 1, "version\n= 2\nversion = 1\n"),
+        (re.compile("VERSION = 1", re.IGNORECASE), "v", 0, "v\nv\n"),
+    ],
+)
+def test_regex_replacer__literal_pattern(
+    tmp_path: pathlib.Path,
+    regex: Union[str, re.Pattern],
+    replacement: str,
+    replacement_count: int,
+    expected_content: str,
+    regex_replacer_plugin: regex_replacer.RegexReplacerPlugin,
+):
+    """Tests, if literal patterns are replaced like regex patterns."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("version = 1\nversion = 1\n", encoding="utf-8")
+    regex_replacer_plugin.run("test.txt", regex, replacement, replacement_count)
 
-    result = test_file.read_text(encoding="utf-8")
-    assert result.count(replacement_str) == (replacement_count if replacement_count != 0 else 3)
-    assert result.count(str_1) == 0
-    assert result.count(str_2) == (0 if replacement_count in [0, 2, 3] else 1)
-    assert result.count(str_3) == (0 if replacement_count in [0, 3] else 1)
+    assert test_file.read_text(encoding="utf-8") == expected_content
+
+    with pytest.raises(regex_replacer.ModificationException):
+        regex_replacer_plugin.run("test.txt", "version = 3", "_")
+
+
+def test_regex_replacer__file_is_replaced_atomically(
+    tmp_path: pathlib.Path, regex_replacer_plugin: regex_replacer.RegexReplacerPlugin
+):
+    """Tests, if the updated file keeps its permissions, and no temporary file is left behind."""
+    test_file = tmp_path / "test.sh"
+    test_file.write_text("VERSION=1.0.0\n", encoding="utf-8")
+    test_file.chmod(0o755)
+
+    regex_replacer_plugin.run("test.sh", r"VERSION=.+", "VERSION=1.1.0")
+
+    assert test_file.read_text(encoding="utf-8") == "VERSION=1.1.0\n"
+    assert test_file.stat().st_mode & 0o777 == 0o755
+    assert [path.name for path in tmp_path.iterdir()] == ["test.sh"]
+
+
+def test_regex_replacer__existing_temporary_file_and_symlink_persist(
+    tmp_path: pathlib.Path, regex_replacer_plugin: regex_replacer.RegexReplacerPlugin
+):
+    """Tests, if files, that are named like temporary files, are kept, and symbolic links are
+    kept as links to the updated file."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("VERSION=1.0.0\n", encoding="utf-8")
+    existing_file = tmp_path / "test.txt.tmp"
+    existing_file.write_text("keep me\n", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(test_file.name)
+
+    regex_replacer_plugin.run("link.txt", r"VERSION=.+", "VERSION=1.1.0")
+
+    assert link.is_symlink()
+    assert test_file.read_text(encoding="utf-8") == "VERSION=1.1.0\n"
+    assert existing_file.read_text(encoding="utf-8") == "keep me\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "link.txt",
+        "test.txt",
+        "test.txt.tmp",
+    ]
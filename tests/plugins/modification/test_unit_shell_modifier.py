@@ -9,15 +9,16 @@ SPDX-License-Identifier: MIT
 """
 
 import pathlib
+import subprocess
 
 import pytest
-from pytest_mock import MockFixture
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.modification_interface import ModificationException
 from easy_release_automation.plugins.modification import shell_modifier
 from easy_release_automation.core import plugin_executor
 from tests.plugins.utils import plugin_loader
+from tests.plugins.utils.fake_process import FakePopen
 
 from ..fixtures.default_config import default_global_config, default_release_entry
 
@@ -38,18 +39,12 @@ def modify_via_shell_plugin(
     return plugin
 
 
-@pytest.fixture
-def subprocess_mock(mocker: MockFixture):
-    return mocker.patch("easy_release_automation.plugins.modification.shell_modifier.subprocess")
-
-
 @pytest.mark.parametrize("return_code", [0, -1])
 def test_shell_modifier__successful_and_failed_subprocess(
     tmp_path: pathlib.Path,
-    mocker: MockFixture,
+    monkeypatch: pytest.MonkeyPatch,
     return_code: int,
     modify_via_shell_plugin: shell_modifier.ShellModificationPlugin,
-    subprocess_mock,
 ):
     """Tests, if the subprocess
     - raises an ModificationException, when subprocess has !=0 returncode.
@@ -57,10 +52,8 @@ def test_shell_modifier__successful_and_failed_subprocess(
     - is called with the expected parameters.
     """
 
-    process_return_mock = mocker.MagicMock()
-    subprocess_mock.Popen.return_value = process_return_mock
-    process_return_mock.poll.return_value = 1  # skip prints
-    process_return_mock.returncode = return_code
+    fake_popen = FakePopen(return_code)
+    monkeypatch.setattr(shell_modifier.subprocess, "Popen", fake_popen)
     command = ["ls", "-la"]
 
     if return_code == 0:
@@ -68,6 +61,4 @@ def test_shell_modifier__successful_and_failed_subprocess(
     else:
         with pytest.raises(ModificationException):
             modify_via_shell_plugin.run(command)
-    subprocess_mock.Popen.assert_called_once_with(
-        command, stdout=subprocess_mock.PIPE, cwd=tmp_path
-    )
+    assert fake_popen.calls == [((command,), {"stdout": subprocess.PIPE, "cwd": tmp_path})]
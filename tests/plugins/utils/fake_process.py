@@ -0,0 +1,57 @@
+"""Fake of subprocess.Popen for the Shell Plugins
+
+Authors:
+    - Claus Seibold <claus.seibold@ingenics-digital.com>
+
+Copyright (c) 2024 Ingenics Digital GmbH
+
+SPDX-License-Identifier: MIT
+"""
+
+import io
+from typing import Iterable, Sequence, Union
+
+
+class FakeProcess:
+    """Already finished process with the given return code and output."""
+
+    def __init__(self, return_code: int, output: Iterable[Union[str, bytes]]):
+        self.returncode = return_code
+        self.stdout = iter(output)
+
+    def poll(self) -> int:
+        """Returns the return code, as the process is already finished."""
+        return self.returncode
+
+    def wait(self) -> int:
+        """Returns the return code, as the process is already finished."""
+        return self.returncode
+
+    def __enter__(self) -> "FakeProcess":
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class FakePopen:
+    """Replacement of subprocess.Popen, that records the arguments of all calls, and returns
+    finished processes with the given return code and output. Raw output is decoded with the given
+    encoding."""
+
+    def __init__(self, return_code: int = 0, output: Sequence[Union[str, bytes]] = ()):
+        self.return_code = return_code
+        self.output = output
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def __call__(self, *args, **kwargs) -> FakeProcess:
+        self.calls.append((args, kwargs))
+        output: Iterable[Union[str, bytes]] = self.output
+        # Raw output is decoded like the text stream of a real process.
+        if "encoding" in kwargs and all(isinstance(line, bytes) for line in output):
+            output = io.TextIOWrapper(
+                io.BytesIO(b"".join(output)),  # type: ignore [arg-type]
+                encoding=kwargs["encoding"],
+                errors=kwargs.get("errors", "strict"),
+            )
+        return FakeProcess(self.return_code, output)
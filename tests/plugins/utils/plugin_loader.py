@@ -8,13 +8,25 @@ Copyright (c) 2024 Ingenics Digital GmbH
 SPDX-License-Identifier: MIT
 """
 
+import functools
 import importlib.metadata
+import sys
 
 
+@functools.lru_cache(maxsize=None)
 def load_plugin_class(entry_point_name: str, entry_point_group: str):
-    """Returns the loaded entrypoint/plugin-class for the given group and name."""
-    entry_points = importlib.metadata.entry_points()[entry_point_group]
+    """Returns the loaded entrypoint/plugin-class for the given group and name. Solely the requested
+    entrypoint is loaded, and the loaded class is cached."""
+    if sys.version_info >= (3, 10):
+        entry_points = importlib.metadata.entry_points(
+            group=entry_point_group, name=entry_point_name
+        )
+    else:
+        entry_points = [
+            entry_point
+            for entry_point in importlib.metadata.entry_points().get(entry_point_group, ())
+            if entry_point.name == entry_point_name
+        ]
     for entry_point in entry_points:
-        if entry_point.name == entry_point_name:
-            return entry_point.load()
+        return entry_point.load()
     raise RuntimeError(f"Plugin not found. {entry_point_name=}, {entry_point_group=}")
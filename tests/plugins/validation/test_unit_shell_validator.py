@@ -9,15 +9,16 @@ SPDX-License-Identifier: MIT
 """
 
 import pathlib
+import subprocess
 
 import pytest
-from pytest_mock import MockFixture
 
 from easy_release_automation.core.configuration import GlobalConfig, ReleaseEntry
 from easy_release_automation.interfaces.validation_interface import ValidationException
 from easy_release_automation.plugins.validation import shell_validator
 from easy_release_automation.core import plugin_executor
 from tests.plugins.utils import plugin_loader
+from tests.plugins.utils.fake_process import FakePopen
 
 from ..fixtures.default_config import default_global_config, default_release_entry
 
@@ -38,28 +39,20 @@ def validate_via_shell_plugin(
     return plugin
 
 
-@pytest.fixture
-def subprocess_mock(mocker: MockFixture):
-    return mocker.patch("easy_release_automation.plugins.validation.shell_validator.subprocess")
-
-
 @pytest.mark.parametrize("return_code", [0, -1])
 def test_successful_and_failed_subprocess(
-    mocker: MockFixture,
+    monkeypatch: pytest.MonkeyPatch,
     tmp_path: pathlib.Path,
     validate_via_shell_plugin: shell_validator.ShellValidationPlugin,
     return_code: int,
-    subprocess_mock,
 ):
     """Tests,
     - if the subprocess raises an ValidationException, when subprocess has !=0 returncode
     - if the subprocess runs through, when subprocess returns 0
     """
 
-    process_return_mock = mocker.MagicMock()
-    subprocess_mock.Popen.return_value = process_return_mock
-    process_return_mock.poll.return_value = 1  # skip prints
-    process_return_mock.returncode = return_code
+    fake_popen = FakePopen(return_code, output=["total 0\n"])
+    monkeypatch.setattr(shell_validator.subprocess, "Popen", fake_popen)
     command = ["ls", "-la"]
 
     if return_code == 0:
@@ -67,6 +60,32 @@ def test_successful_and_failed_subprocess(
     else:
         with pytest.raises(ValidationException):
             validate_via_shell_plugin.run(command)
-    subprocess_mock.Popen.assert_called_once_with(
-        command, stdout=subprocess_mock.PIPE, cwd=tmp_path
-    )
+    assert fake_popen.calls == [
+        (
+            (command,),
+            {
+                "stdout": subprocess.PIPE,
+                "stderr": subprocess.STDOUT,
+                "bufsize": 1,
+                "encoding": "utf-8",
+                "errors": "replace",
+                "cwd": tmp_path,
+            },
+        )
+    ]
+
+
+def test_non_utf8_output(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    validate_via_shell_plugin: shell_validator.ShellValidationPlugin,
+):
+    """Tests, if output, that is not utf-8 encoded, is logged with replaced characters instead of
+    aborting the validation."""
+    fake_popen = FakePopen(0, output=[b"caf\xe9\n", "ümlaut\n".encode()])
+    monkeypatch.setattr(shell_validator.subprocess, "Popen", fake_popen)
+
+    with caplog.at_level("INFO"):
+        validate_via_shell_plugin.run(["ls"])
+    assert "caf\ufffd" in caplog.messages
+    assert "ümlaut" in caplog.messages